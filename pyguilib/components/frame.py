@@ -14,5 +14,12 @@ class Frame(PyGuiInstance, PyGuiLayoutContainer):
         **kwargs: Additional keyword arguments.
     """
 
+    # Attributes of PyGuiLayoutContainer, which can not declare them itself next to PyGuiInstance's slots.
+    __slots__ = (
+        "_layout_instance_child_added_connection",
+        "_layout_instance_child_removed_connection",
+        "_applied_layout",
+    )
+
     def __init__(self, **kwargs) -> "Frame":
         super(Frame, self).__init__(**kwargs)
@@ -1,12 +1,19 @@
 import os
-from typing import List
+from functools import lru_cache
 
 import pygame
 from pygame import Color
-from pygame.event import Event
 
 from pyguilib.components.pygui_instance import PyGuiInstance
 
+CACHED_IMAGE_SURFACES_LIMIT = 8
+
+
+@lru_cache(maxsize=128)
+def _load_image_surface(path: str) -> pygame.Surface:
+    # The loaded surface is shared between every ImageLabel using the same path, it must never be drawn on.
+    return pygame.image.load(path).convert_alpha()
+
 
 class ImageLabel(PyGuiInstance):
     """
@@ -22,17 +29,24 @@ class ImageLabel(PyGuiInstance):
         Exception: If no image is provided or if there is an error loading the image.
 
     Properties:
-        image_color (Color): The image color.
-        image_transparency (int): The image transparency.
+        image_color (Color): The image color, changes are drawn on the next update.
+        image_transparency (int): The image transparency, changes are drawn on the next update.
     """
 
+    __slots__ = (
+        "_image_surface",
+        "_image_color",
+        "_image_transparency",
+        "_cached_image_surfaces",
+    )
+
     def __init__(self, **kwargs) -> "ImageLabel":
         image = kwargs.get("image", None)
         if image is None:
             raise Exception("You must pass an image to the ImageLabel component")
 
         try:
-            self._image_surface = pygame.image.load(os.path.join(os.getcwd(), image)).convert_alpha()
+            self._image_surface = _load_image_surface(image if os.path.isabs(image) else os.path.join(os.getcwd(), image))
         except Exception as exception:
             raise Exception(f"Error loading image: {exception}")
 
@@ -43,12 +57,10 @@ class ImageLabel(PyGuiInstance):
         self._image_color = kwargs.get("image_color", (255, 255, 255, 255))
         self._image_transparency = kwargs.get("image_transparency", 255)
 
-        self._register_property_change_listener("image_color", lambda _: self.image_color)
-        self._register_property_change_listener("image_transparency", lambda _: self.image_transparency)
-
-        self._add_instance_updater_handler(self.__instance_updater)
         self._add_instance_drawer_handler(self.__instance_drawer)
 
+        self._cached_image_surfaces = {}
+
     @property
     def image_color(self) -> Color:
         """
@@ -63,7 +75,7 @@ class ImageLabel(PyGuiInstance):
     @PyGuiInstance._update_screen_buffer
     def image_color(self, value: Color):
         self._image_color = value
-        self._invoke_property_change_listener("image_color")
+        self._invoke_property_change_listener("image_color", value)
 
     @property
     def image_transparency(self) -> int:
@@ -79,15 +91,29 @@ class ImageLabel(PyGuiInstance):
     @PyGuiInstance._update_screen_buffer
     def image_transparency(self, value: int):
         self._image_transparency = value
-        self._invoke_property_change_listener("image_transparency")
-
-    def __instance_updater(self, events: List[Event]):
-        pass
+        self._invoke_property_change_listener("image_transparency", value)
 
     def __instance_drawer(self):
-        image_surface_copy = pygame.transform.scale(self._image_surface.copy(), self.absolute_size)
+        absolute_size = self.absolute_size
+        scaled_size = (int(absolute_size.x), int(absolute_size.y))
+
+        image_tint = (tuple(self.image_color), self.image_transparency)
+
+        cached_image_surface = self._cached_image_surfaces.get(scaled_size)
+        if cached_image_surface is None or cached_image_surface[0] != image_tint:
+            if cached_image_surface is not None:
+                # Only the tint changed, scale back into the existing surface instead of allocating a new one.
+                image_surface = cached_image_surface[1]
+                pygame.transform.scale(self._image_surface, scaled_size, image_surface)
+            else:
+                if len(self._cached_image_surfaces) >= CACHED_IMAGE_SURFACES_LIMIT:
+                    del self._cached_image_surfaces[next(iter(self._cached_image_surfaces))]
+
+                image_surface = pygame.transform.scale(self._image_surface, scaled_size)
+
+            image_surface.set_alpha(self.image_transparency)
+            image_surface.fill(self.image_color, special_flags=pygame.BLEND_RGBA_MULT)
 
-        image_surface_copy.set_alpha(self.image_transparency)
-        image_surface_copy.fill(self.image_color, special_flags=pygame.BLEND_RGBA_MULT)
+            self._cached_image_surfaces[scaled_size] = cached_image_surface = (image_tint, image_surface)
 
-        self._get_drawable_surface().blit(image_surface_copy, self.absolute_position)
+        return [(cached_image_surface[1], self.absolute_position)]
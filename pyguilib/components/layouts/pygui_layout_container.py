@@ -1,7 +1,40 @@
+from functools import partial
+
 from pyguilib.components.layouts.pygui_layout_style import PyGuiLayoutStyle
 from pyguilib.components.pygui_instance import PyGuiInstance
 
 
+def _watch_layout_instance_child_layout_order(layout: PyGuiLayoutStyle, child: PyGuiInstance):
+    layout._layout_order_connections[child] = child.get_property_changed_signal("layout_order").connect(
+        partial(_on_layout_instance_child_layout_order_changed, layout, child)
+    )
+
+
+@PyGuiLayoutStyle._update_layout_order
+def _on_layout_instance_child_added(layout: PyGuiLayoutStyle, child: PyGuiInstance):
+    layout._insert_instance_child(child)
+    _watch_layout_instance_child_layout_order(layout, child)
+    layout._on_layout_instance_child_added(child)
+
+
+@PyGuiLayoutStyle._update_layout_order
+def _on_layout_instance_child_removed(layout: PyGuiLayoutStyle, child: PyGuiInstance):
+    layout._remove_instance_child(child)
+
+    layout_order_connection = layout._layout_order_connections.pop(child, None)
+    if layout_order_connection is not None:
+        layout_order_connection.disconnect()
+
+    layout._on_layout_instance_child_removed(child)
+
+
+@PyGuiLayoutStyle._update_layout_order
+def _on_layout_instance_child_layout_order_changed(layout: PyGuiLayoutStyle, child: PyGuiInstance, _):
+    # Still where its previous layout order sorted it, the child is moved to where the new one does.
+    layout._remove_instance_child(child)
+    layout._insert_instance_child(child)
+
+
 class PyGuiLayoutContainer(object):
     """
     PyGuiLayoutContainer class serves as a container for managing layout styles applied to a PyGuiInstance.
@@ -17,9 +50,11 @@ class PyGuiLayoutContainer(object):
         applied_layout (PyGuiLayoutStyle): The currently applied layout style.
     """
 
-    def __init__(self, **kwargs) -> "PyGuiLayoutContainer":
-        super(PyGuiLayoutContainer, self).__init__()
+    # Empty so it can be mixed with PyGuiInstance, the class using it declares the slots of its attributes.
+    __slots__ = ()
 
+    def __init__(self, **kwargs) -> "PyGuiLayoutContainer":
+        # Reached through PyGuiInstance's super().__init__() call, the next class in the MRO is always object.
         self._layout_instance_child_added_connection = None
         self._layout_instance_child_removed_connection = None
 
@@ -33,10 +68,7 @@ class PyGuiLayoutContainer(object):
         Returns:
             PyGuiLayoutStyle: The currently applied layout style, or None if no layout is applied.
         """
-        try:
-            return self._applied_layout
-        except AttributeError:
-            return None
+        return self._applied_layout
 
     def apply_layout(self, layout: PyGuiLayoutStyle):
         """
@@ -55,30 +87,15 @@ class PyGuiLayoutContainer(object):
 
         self._applied_layout = layout
 
-        @PyGuiLayoutStyle._update_layout_order
-        def _on_layout_instance_child_added(self, child: PyGuiInstance):
-            layout._sorted_instance_childs.append(child)
-            layout._sort_instance_childs()
-            layout._on_layout_instance_child_added(child)
-
-        @PyGuiLayoutStyle._update_layout_order
-        def _on_layout_instance_child_removed(self, child: PyGuiInstance):
-            layout._sorted_instance_childs.remove(child)
-            layout._sort_instance_childs()
-            layout._on_layout_instance_child_removed(layout, child)
-
-        self._layout_instance_child_added_connection = self.child_added.connect(lambda child: _on_layout_instance_child_added(layout, child))
-        self._layout_instance_child_removed_connection = self.child_removed.connect(lambda child: _on_layout_instance_child_removed(layout, child))
-
-        for child_name in self._childrens:
-            layout._sorted_instance_childs.append(self._childrens[child_name])
-            layout._on_layout_instance_child_added(self._childrens[child_name])
+        self._layout_instance_child_added_connection = self.child_added.connect(partial(_on_layout_instance_child_added, layout))
+        self._layout_instance_child_removed_connection = self.child_removed.connect(partial(_on_layout_instance_child_removed, layout))
 
+        layout._sorted_instance_childs = list(self._childrens.values())
         layout._sort_instance_childs()
-        layout._on_layout_applied()
 
-        @PyGuiLayoutStyle._update_layout_order
-        def initialize(_):
-            layout._sort_instance_childs()
+        for child in layout._sorted_instance_childs:
+            _watch_layout_instance_child_layout_order(layout, child)
+            layout._on_layout_instance_child_added(child)
 
-        initialize(layout)
+        layout._on_layout_applied()
+        layout._layout_order_manager(layout._sorted_instance_childs)
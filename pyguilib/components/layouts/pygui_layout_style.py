@@ -1,10 +1,12 @@
-from enum import Enum
+import bisect
+from enum import IntEnum
+from operator import attrgetter
 from typing import Any, Callable, Optional
 
 from pyguilib.components.pygui_instance import PyGuiInstance
 
 
-class HorizontalAlignment(Enum):
+class HorizontalAlignment(IntEnum):
     """
     Enumeration for horizontal alignment options.
 
@@ -19,7 +21,7 @@ class HorizontalAlignment(Enum):
     RIGHT = 2
 
 
-class VerticalAlignment(Enum):
+class VerticalAlignment(IntEnum):
     """
     Enumeration for horizontal alignment options.
 
@@ -34,7 +36,7 @@ class VerticalAlignment(Enum):
     BOTTOM = 2
 
 
-class FillDirection(Enum):
+class FillDirection(IntEnum):
     """
     Enumeration for vertical alignment options.
 
@@ -47,7 +49,7 @@ class FillDirection(Enum):
     VERTICAL = 1
 
 
-class SortOrder(Enum):
+class SortOrder(IntEnum):
     """
     Enumeration for sort order options.
 
@@ -62,16 +64,21 @@ class SortOrder(Enum):
     CUSTOM = 2
 
 
-def name_sorter(self: "PyGuiLayoutStyle", child: "PyGuiInstance") -> int:
-    return 0
+# Attribute getters run in C, which keeps the per comparison cost of sorting down.
+name_sorter = attrgetter("name")
+layout_order_sorter = attrgetter("layout_order")
 
 
-def layout_order_sorter(self: "PyGuiLayoutStyle", child: "PyGuiInstance") -> int:
-    return child.layout_order
+def custom_sorter(child: "PyGuiInstance") -> int:
+    return 0
 
 
-def custom_sorter(self: "PyGuiLayoutStyle", child: "PyGuiInstance") -> int:
-    return 0
+# Indexed by SortOrder.
+SORT_ORDER_SORTERS = (
+    name_sorter,
+    layout_order_sorter,
+    custom_sorter,
+)
 
 
 class PyGuiLayoutStyle(object):
@@ -94,6 +101,22 @@ class PyGuiLayoutStyle(object):
         sort_order (SortOrder): The sorting order for child instances.
     """
 
+    __slots__ = (
+        "_horizontal_alignment",
+        "_vertical_alignment",
+        "_fill_direction",
+        "_sort_order",
+        "_on_layout_instance_child_added",
+        "_on_layout_instance_child_removed",
+        "_on_layout_applied",
+        "_on_layout_removed",
+        "_layout_order_manager",
+        "_instance",
+        "_sorted_instance_childs",
+        "_sort_key",
+        "_layout_order_connections",
+    )
+
     def __init__(
         self,
         on_layout_instance_child_added: Optional[Callable[[Any], Any]] = lambda: None,
@@ -108,7 +131,7 @@ class PyGuiLayoutStyle(object):
         self._horizontal_alignment = kwargs.get("horizontal_alignment", HorizontalAlignment.LEFT)
         self._vertical_alignment = kwargs.get("vertical_alignment", VerticalAlignment.TOP)
         self._fill_direction = kwargs.get("fill_direction", FillDirection.HORIZONTAL)
-        self._sort_order = kwargs.get("sort_order", SortOrder.NAME)
+        self._sort_order = kwargs.get("sort_order", SortOrder.LAYOUT_ORDER)
 
         self._on_layout_instance_child_added = on_layout_instance_child_added
         self._on_layout_instance_child_removed = on_layout_instance_child_removed
@@ -116,8 +139,14 @@ class PyGuiLayoutStyle(object):
         self._on_layout_removed = on_layout_removed
         self._layout_order_manager = layout_order_manager
 
+        self._instance = None
         self._sorted_instance_childs = []
 
+        # Connections to the layout_order changed signal of each child, a child is sorted again whenever it fires.
+        self._layout_order_connections = {}
+
+        self._sort_key = SORT_ORDER_SORTERS[self._sort_order]
+
     def _update_layout_order(original_caller: Callable[["PyGuiLayoutStyle", Any], None], *_) -> Callable[[Any], None]:
         """
         Decorator method for updating layout order.
@@ -137,9 +166,43 @@ class PyGuiLayoutStyle(object):
 
     def _sort_instance_childs(self):
         """
-        Sorts child instances based on layout order.
+        Sorts child instances based on the sort order.
+        """
+        self._sorted_instance_childs.sort(key=self._sort_key)
+
+    def _insert_instance_child(self, child: "PyGuiInstance"):
+        """
+        Inserts a child instance while keeping the child instances sorted by the sort order.
+
+        Args:
+            child (PyGuiInstance): The child instance to be inserted.
+        """
+        bisect.insort(self._sorted_instance_childs, child, key=self._sort_key)
+
+    def _remove_instance_child(self, child: "PyGuiInstance"):
+        """
+        Removes a child instance, the remaining child instances stay sorted.
+
+        Args:
+            child (PyGuiInstance): The child instance to be removed.
         """
-        self._sorted_instance_childs = sorted(self._sorted_instance_childs, key=lambda child: child.layout_order)
+        sorted_instance_childs = self._sorted_instance_childs
+
+        # Binary search the run of childs sharing the same sort key and only scan that run.
+        child_sort_key = self._sort_key(child)
+        index = bisect.bisect_left(sorted_instance_childs, child_sort_key, key=self._sort_key)
+
+        while index < len(sorted_instance_childs) and sorted_instance_childs[index] is not child:
+            if self._sort_key(sorted_instance_childs[index]) != child_sort_key:
+                break
+
+            index += 1
+
+        if index < len(sorted_instance_childs) and sorted_instance_childs[index] is child:
+            del sorted_instance_childs[index]
+        else:
+            # The child sort key changed since it was inserted.
+            sorted_instance_childs.remove(child)
 
     @property
     def instance(self) -> "PyGuiInstance":
@@ -149,10 +212,7 @@ class PyGuiLayoutStyle(object):
         Returns:
             PyGuiInstance: The associated PyGuiInstance.
         """
-        try:
-            return self._instance
-        except AttributeError:
-            return None
+        return self._instance
 
     @property
     def horizontal_alignment(self) -> HorizontalAlignment:
@@ -213,3 +273,5 @@ class PyGuiLayoutStyle(object):
     @_update_layout_order
     def sort_order(self, value: SortOrder):
         self._sort_order = value
+        self._sort_key = SORT_ORDER_SORTERS[value]
+        self._sort_instance_childs()
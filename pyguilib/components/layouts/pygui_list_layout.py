@@ -1,4 +1,6 @@
-from typing import List
+import bisect
+from operator import attrgetter, itemgetter
+from typing import Callable, List, Optional, Tuple
 
 from pygame import Vector2
 
@@ -11,6 +13,105 @@ from pyguilib.components.layouts.pygui_layout_style import (
 from pyguilib.components.pygui_instance import PyGuiInstance
 from pyguilib.utilities.udim import UDim, UDim2
 
+_get_absolute_size = attrgetter("absolute_size")
+_get_row_start_index = itemgetter(0)
+
+# Shared by every child added to a list layout, the layout always replaces it before the child is drawn.
+_UDIM2_ZERO = UDim2.of(0, 0, 0, 0)
+
+
+def _center_row(child_major_offsets: List[float], row_start_index: int, row_major_size: float, parent_major_size: float):
+    row_shift = (parent_major_size - row_major_size) / 2
+
+    for child_index in range(row_start_index, len(child_major_offsets)):
+        child_major_offsets[child_index] += row_shift
+
+
+def _build_packer(horizontal_alignment: HorizontalAlignment, vertical_alignment: VerticalAlignment) -> Callable:
+    """
+    Builds the function packing the childs of a list layout into rows for the given alignments.
+
+    Args:
+        horizontal_alignment (HorizontalAlignment): The alignment of the childs along the rows.
+        vertical_alignment (VerticalAlignment): The alignment of the rows.
+
+    Returns:
+        Callable: The packer, taking the major and minor sizes of the childs and the parent and appending the major and
+        minor offsets of the childs to the given lists, starting from the given row.
+    """
+    assert vertical_alignment != VerticalAlignment.CENTER, "VerticalAlignment.CENTER is not implemented for PyGuiListLayout yet."
+
+    centered = horizontal_alignment == HorizontalAlignment.CENTER
+    packed_from_end = horizontal_alignment == HorizontalAlignment.RIGHT
+    packed_from_bottom = vertical_alignment == VerticalAlignment.BOTTOM
+
+    def packer(
+        child_major_sizes: List[float],
+        child_minor_sizes: List[float],
+        parent_major_size: float,
+        parent_minor_size: float,
+        child_major_offsets: List[float],
+        child_minor_offsets: List[float],
+        row_starts: List[Tuple[int, float]],
+        row_start: Tuple[int, float] = (0, 0),
+    ):
+        append_child_major_offset = child_major_offsets.append
+
+        (row_start_index, current_row_minor_size) = row_start
+        row_start_indices = [row_start_index]
+
+        current_row_major_size = 0
+
+        # Rows are broken on the major sizes only, they are stacked once all of them are known.
+        for child_index, child_major_size in enumerate(child_major_sizes[row_start_index:], row_start_index):
+            # The first child always starts the row it is packed in.
+            if current_row_major_size + child_major_size > parent_major_size and child_index != row_start_index:
+                if centered:
+                    _center_row(child_major_offsets, row_start_index, current_row_major_size, parent_major_size)
+
+                row_start_index = child_index
+                row_start_indices.append(row_start_index)
+
+                current_row_major_size = 0
+
+            if packed_from_end:
+                append_child_major_offset(parent_major_size - current_row_major_size - child_major_size)
+            else:
+                append_child_major_offset(current_row_major_size)
+
+            current_row_major_size += child_major_size
+
+        if centered:
+            _center_row(child_major_offsets, row_start_index, current_row_major_size, parent_major_size)
+
+        row_start_indices.append(len(child_major_sizes))
+
+        # Every row is as tall as its tallest child and remembers where it starts so a later pass can resume from it.
+        for row_start_index, row_end_index in zip(row_start_indices, row_start_indices[1:]):
+            row_child_minor_sizes = child_minor_sizes[row_start_index:row_end_index]
+
+            if packed_from_bottom:
+                child_minor_offsets.extend([parent_minor_size - child_minor_size - current_row_minor_size for child_minor_size in row_child_minor_sizes])
+            else:
+                child_minor_offsets.extend([current_row_minor_size] * len(row_child_minor_sizes))
+
+            row_starts.append((row_start_index, current_row_minor_size))
+            current_row_minor_size += max(row_child_minor_sizes, default=0)
+
+    return packer
+
+
+def _get_first_changed_child_index(last_layout_signature: Optional[tuple], layout_signature: tuple) -> int:
+    # Only the childs and their sizes can be compared one by one, anything else changing moves every child.
+    if last_layout_signature is None or last_layout_signature[:5] != layout_signature[:5]:
+        return 0
+
+    for child_index, (last_child_entry, child_entry) in enumerate(zip(zip(*last_layout_signature[5:]), zip(*layout_signature[5:]))):
+        if last_child_entry != child_entry:
+            return child_index
+
+    return min(len(last_layout_signature[5]), len(layout_signature[5]))
+
 
 class PyGuiListLayout(PyGuiLayoutStyle):
     """
@@ -31,6 +132,22 @@ class PyGuiListLayout(PyGuiLayoutStyle):
         right_margin (UDim): The right margin for child instances.
     """
 
+    __slots__ = (
+        "_horizontal_padding",
+        "_vertical_padding",
+        "_top_margin",
+        "_bottom_margin",
+        "_left_margin",
+        "_right_margin",
+        "_packer",
+        "_last_layout_signature",
+        "_layout_signature_hits",
+        "_layout_signature_misses",
+        "_child_major_offsets",
+        "_child_minor_offsets",
+        "_row_starts",
+    )
+
     def __init__(self, **kwargs) -> "PyGuiListLayout":
         super(PyGuiListLayout, self).__init__(
             **kwargs,
@@ -41,13 +158,33 @@ class PyGuiListLayout(PyGuiLayoutStyle):
             layout_order_manager=self.__layout_order_manager,
         )
 
-        self._horizontal_padding = kwargs.get("padding", UDim(0, 0))
-        self._vertical_padding = kwargs.get("padding", UDim(0, 0))
+        self._horizontal_padding = kwargs.get("padding", UDim.of(0, 0))
+        self._vertical_padding = kwargs.get("padding", UDim.of(0, 0))
+
+        self._top_margin = kwargs.get("top_margin", UDim.of(0, 0))
+        self._bottom_margin = kwargs.get("bottom_margin", UDim.of(0, 0))
+        self._left_margin = kwargs.get("left_margin", UDim.of(0, 0))
+        self._right_margin = kwargs.get("right_margin", UDim.of(0, 0))
 
-        self._top_margin = kwargs.get("top_margin", UDim(0, 0))
-        self._bottom_margin = kwargs.get("bottom_margin", UDim(0, 0))
-        self._left_margin = kwargs.get("left_margin", UDim(0, 0))
-        self._right_margin = kwargs.get("right_margin", UDim(0, 0))
+        self._packer = None
+        self._last_layout_signature = None
+
+        self._child_major_offsets = []
+        self._child_minor_offsets = []
+        self._row_starts = []
+
+        self._layout_signature_hits = 0
+        self._layout_signature_misses = 0
+
+    @PyGuiLayoutStyle.horizontal_alignment.setter
+    def horizontal_alignment(self, value: HorizontalAlignment):
+        self._packer = None
+        PyGuiLayoutStyle.horizontal_alignment.fset(self, value)
+
+    @PyGuiLayoutStyle.vertical_alignment.setter
+    def vertical_alignment(self, value: VerticalAlignment):
+        self._packer = None
+        PyGuiLayoutStyle.vertical_alignment.fset(self, value)
 
     @property
     def horizontal_padding(self) -> UDim:
@@ -143,7 +280,7 @@ class PyGuiListLayout(PyGuiLayoutStyle):
         Note:
             Overrides the parent method to set initial position and anchor point for added child elements.
         """
-        child._add_property_override("position", UDim2(0, 0, 0, 0))
+        child._add_property_override("position", _UDIM2_ZERO)
         child._add_property_override("anchor_point", Vector2(0, 0))
 
     def __on_layout_instance_child_removed(self, child: PyGuiInstance):
@@ -187,96 +324,115 @@ class PyGuiListLayout(PyGuiLayoutStyle):
         Note:
             Overrides the parent method to implement the logic for ordering and positioning child elements.
         """
-        largest_child_width = 0
-        largest_child_height = 0
-
-        current_row_width = 0
-        current_row_height = 0
-
-        (parent_instance_x_position, parent_instance_y_position) = self.instance.absolute_position
-        (parent_instance_width, parent_instance_height) = self.instance.absolute_size
-
-        if self.fill_direction == FillDirection.VERTICAL:
-            parent_instance_width, parent_instance_height = parent_instance_height, parent_instance_width
-
-        # Used by HorizontalAlignment.CENTER only
-        last_row_index = 0
-        current_row_index = 0
-
-        for child in childs:
-            child.BLOCKING_SCREEN_BUFFER_UPDATE = True
-
-            child_position_x_offset = 0
-            child_position_y_offset = 0
-
-            (child_width, child_height) = child.absolute_size
-
-            match self.horizontal_alignment:
-                case HorizontalAlignment.LEFT:
-                    if current_row_width + child_width > parent_instance_width:
-                        child_position_x_offset, current_row_width, current_row_height = (
-                            0,
-                            child_width,
-                            current_row_height + largest_child_height,
-                        )
-                    else:
-                        child_position_x_offset, current_row_width = (
-                            current_row_width,
-                            current_row_width + child_width,
-                        )
-
-                case HorizontalAlignment.CENTER:
-                    if current_row_width + child_width > parent_instance_width:
-                        child_position_x_offset, current_row_width, current_row_height = (
-                            (parent_instance_width - child_width) / 2,
-                            child_width,
-                            current_row_height + largest_child_height,
-                        )
-
-                        last_row_index = current_row_index
-                    else:
-                        for child in childs[last_row_index : current_row_index + 1]:
-                            child._add_property_override("position", UDim2(0, child.position.x.offset - child_width / 2, 0, child.position.y.offset))
-
-                        child_position_x_offset, current_row_width = (
-                            (parent_instance_width - child_width + current_row_width) / 2,
-                            current_row_width + child_width,
-                        )
-
-                case HorizontalAlignment.RIGHT:
-                    if current_row_width + child_width > parent_instance_width:
-                        child_position_x_offset, current_row_width, current_row_height = (
-                            parent_instance_width - child_width,
-                            child_width,
-                            current_row_height + largest_child_height,
-                        )
-                    else:
-                        child_position_x_offset, current_row_width = (
-                            parent_instance_width - current_row_width - child_width,
-                            current_row_width + child_width,
-                        )
-
-            match self.vertical_alignment:
-                case VerticalAlignment.TOP:
-                    child_position_y_offset = current_row_height
-
-                case VerticalAlignment.CENTER:
-                    assert False, "VerticalAlignment.CENTER is not implemented for PyGuiListLayout yet."
-                case VerticalAlignment.BOTTOM:
-                    child_position_y_offset = parent_instance_height - child_height - current_row_height
-
-            current_row_index += 1
-
-            largest_child_width = max(largest_child_width, child_width)
-            largest_child_height = max(largest_child_height, child_height)
-
-            if self.fill_direction == FillDirection.VERTICAL:
-                child_position_x_offset, child_position_y_offset = child_position_y_offset, child_position_x_offset
-
-            child._add_property_override("position", UDim2(0, child_position_x_offset, 0, child_position_y_offset))
-
-        for child in childs:
-            child.BLOCKING_SCREEN_BUFFER_UPDATE = False
-
-        self.instance.clear()
-        self.instance.draw()
+        # Nothing to position, the next child added starts over from a full pass.
+        if self.instance is None or not childs:
+            self._last_layout_signature = None
+            return
+
+        # Rows are packed along the major axis and stacked along the minor axis, the fill direction decides which screen
+        # axis each of them is so the packing below never has to care about it.
+        horizontal_alignment = self.horizontal_alignment
+        vertical_alignment = self.vertical_alignment
+        fill_direction = self.fill_direction
+
+        vertical = fill_direction == FillDirection.VERTICAL
+
+        major_axis = 1 if vertical else 0
+        minor_axis = 1 - major_axis
+
+        parent_instance_size = self.instance.absolute_size
+
+        parent_instance_major_size = parent_instance_size[major_axis]
+        parent_instance_minor_size = parent_instance_size[minor_axis]
+
+        # Sizes are gathered up front so the packing loop below only deals with plain numbers.
+        child_sizes = list(map(_get_absolute_size, childs))
+
+        child_major_sizes = [child_size[major_axis] for child_size in child_sizes]
+        child_minor_sizes = [child_size[minor_axis] for child_size in child_sizes]
+
+        # Nothing that affects the positions changed since the last pass, the childs are already where they belong.
+        layout_signature = (
+            parent_instance_major_size,
+            parent_instance_minor_size,
+            horizontal_alignment,
+            vertical_alignment,
+            fill_direction,
+            tuple(childs),
+            tuple(child_major_sizes),
+            tuple(child_minor_sizes),
+        )
+
+        if layout_signature == self._last_layout_signature:
+            self._layout_signature_hits += 1
+            return
+
+        self._layout_signature_misses += 1
+
+        # The childs before the first changed one keep their positions. Packing resumes from the last row starting before
+        # it, a row starting right at the changed child was broken because of it and has to be packed again as well.
+        resume_index = _get_first_changed_child_index(self._last_layout_signature, layout_signature)
+        self._last_layout_signature = layout_signature
+
+        child_major_offsets = self._child_major_offsets
+        child_minor_offsets = self._child_minor_offsets
+        row_starts = self._row_starts
+
+        if resume_index > 0:
+            row_index = bisect.bisect_left(row_starts, resume_index, key=_get_row_start_index) - 1
+            row_start = row_starts[row_index]
+        else:
+            row_index = 0
+            row_start = (0, 0)
+
+        resume_index = row_start[0]
+
+        del child_major_offsets[resume_index:]
+        del child_minor_offsets[resume_index:]
+        del row_starts[row_index:]
+
+        # Rebuilt only after one of the alignments changed.
+        if self._packer is None:
+            self._packer = _build_packer(horizontal_alignment, vertical_alignment)
+
+        self._packer(
+            child_major_sizes,
+            child_minor_sizes,
+            parent_instance_major_size,
+            parent_instance_minor_size,
+            child_major_offsets,
+            child_minor_offsets,
+            row_starts,
+            row_start,
+        )
+
+        if vertical:
+            self._set_positions_batch(childs[resume_index:], child_minor_offsets[resume_index:], child_major_offsets[resume_index:])
+        else:
+            self._set_positions_batch(childs[resume_index:], child_major_offsets[resume_index:], child_minor_offsets[resume_index:])
+
+    def _set_positions_batch(self, childs: List[PyGuiInstance], child_x_offsets: List[float], child_y_offsets: List[float]):
+        """
+        Writes the computed positions of the child elements and requests a single redraw of the instance, if any position was written.
+
+        Args:
+            childs (List[PyGuiInstance]): List of child PyGuiInstance objects.
+            child_x_offsets (List[float]): The x offset of each child.
+            child_y_offsets (List[float]): The y offset of each child.
+        """
+        if not childs:
+            return
+
+        instance = self.instance
+        from_offset = UDim2.from_offset
+
+        # The childrens may have been laid out outside of the instance, where they were has to be redrawn as well.
+        previous_subtree_rect = instance._get_subtree_rect()
+
+        # Blocking once for every child replaces toggling the flag on each of them (which also redrew the instance when
+        # the last child got unblocked, on top of the redraw below).
+        with instance._block_childs_screen_buffer_updates():
+            for child, child_position_x_offset, child_position_y_offset in zip(childs, child_x_offsets, child_y_offsets):
+                child._add_property_override("position", from_offset(child_position_x_offset, child_position_y_offset))
+
+        instance._mark_dirty(previous_subtree_rect.union(instance._get_subtree_rect()))
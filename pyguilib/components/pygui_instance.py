@@ -1,14 +1,69 @@
-import uuid
-from typing import Any, Callable, List, Optional
+import bisect
+import itertools
+import math
+from contextlib import contextmanager
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple
 
 import pygame
-from pygame import SRCALPHA, Color, Surface, Vector2
+from pygame import SRCALPHA, Color, Rect, Surface, Vector2
 from pygame.event import Event
 
 from pyguilib.utilities.quadtree import QuadTreeItem
 from pyguilib.utilities.signal import PyGuiSignal
 from pyguilib.utilities.udim import UDim2
 
+_get_draw_order = attrgetter("draw_order")
+
+# Numbers the GUI elements created without a name.
+_unnamed_instances_counter = itertools.count()
+
+# GUI elements moved since their quadtree item was last inserted, reinserted at once by flush_moved_instances.
+_moved_instances = {}
+
+# Rects of the display waiting to be redrawn, by the root GUI element they have to be redrawn from.
+_dirty_rects = {}
+
+# Shared by every GUI element until it gets its first child or property signal, replaced by a dict of its own then.
+_EMPTY_DICT = MappingProxyType({})
+
+# Value of an override slot while the property is not overridden.
+_UNSET = object()
+
+
+def _bake_transparency(color: Color, transparency: float) -> Color:
+    baked_color = Color(color)
+    baked_color.a = round(baked_color.a * transparency / 255)
+
+    return baked_color
+
+
+def _get_blit_sequence_extent(blit_sequence: List[Tuple[Surface, Vector2]]) -> Optional[Rect]:
+    if not blit_sequence:
+        return None
+
+    # Rounded outwards (and one pixel further) like the absolute rects, the positions may be fractional.
+    rects = [Rect(math.floor(x), math.floor(y), surface.get_width() + 1, surface.get_height() + 1) for surface, (x, y) in blit_sequence]
+
+    return rects[0].unionall(rects[1:]) if len(rects) > 1 else rects[0]
+
+
+class _XY(NamedTuple):
+    """
+    Absolute position or size of a GUI element, accepted by pygame wherever a Vector2 is.
+    """
+
+    x: float
+    y: float
+
+
+# Signals of a GUI element only created once they are first accessed, most elements never use them.
+LAZILY_CREATED_SIGNALS = frozenset(("mouse_moved", "mouse_entered", "mouse_leaving", "mouse_button_down", "mouse_button_up"))
+
+# Properties the absolute position and size of a GUI element (and all of its descendants) are computed from.
+ABSOLUTE_GEOMETRY_PROPERTIES = ("position", "size", "anchor_point")
+
 
 class PyGuiInstance(object):
     """
@@ -33,6 +88,7 @@ class PyGuiInstance(object):
         update(events: List[Event]): Update the GUI instance based on events.
         clear(): Clear the GUI instance.
         draw(): Draw the GUI instance.
+        invalidate_display(): Drop the cached display surface after the display mode changed.
 
     Properties:
         visible (bool): Property indicating whether the GUI instance is visible.
@@ -42,9 +98,9 @@ class PyGuiInstance(object):
         border_color (Color): Property indicating the border color of the GUI instance.
         border_size (int): Property indicating the border size of the GUI instance.
         position (UDim2): Property indicating the position of the GUI instance.
-        absolute_position (Vector2): Property indicating the absolute position of the GUI instance.
+        absolute_position (Tuple[float, float]): Property indicating the absolute position of the GUI instance.
         size (UDim2): Property indicating the size of the GUI instance.
-        absolute_size (Vector2): Property indicating the absolute size of the GUI instance.
+        absolute_size (Tuple[float, float]): Property indicating the absolute size of the GUI instance.
         anchor_point (Vector2): Property indicating the anchor point of the GUI instance.
         layout_order (int): Property indicating the layout order of the GUI instance.
         parent (Optional[PyGuiInstance]): Property indicating the parent GUI instance.
@@ -52,6 +108,53 @@ class PyGuiInstance(object):
         BLOCKING_SCREEN_BUFFER_UPDATE (int): Property to block screen buffer updates.
     """
 
+    __slots__ = (
+        "_visible",
+        "_draw_order",
+        "_background_color",
+        "_background_transparency",
+        "_border_color",
+        "_border_size",
+        "_position",
+        "_size",
+        "_anchor_point",
+        "_position_override",
+        "_size_override",
+        "_anchor_point_override",
+        "_layout_order",
+        "_parent",
+        "__instance_updaters",
+        "__instance_drawers",
+        "_name",
+        "_childrens",
+        "_sorted_childrens",
+        "_flattened_subtree",
+        "_properties_listeners",
+        "__instance_depth",
+        "_absolute_position",
+        "_absolute_size",
+        "_surface",
+        "_surface_key",
+        "_surface_stale",
+        "_drawn_extent",
+        "_root_quadtree_reference",
+        "_quadtree_item",
+        "child_added",
+        "child_removed",
+        "mouse_moved",
+        "mouse_entered",
+        "mouse_leaving",
+        "mouse_button_down",
+        "mouse_button_up",
+        "_BLOCKING_SCREEN_BUFFER_UPDATE",
+        "_blocked_subtree_rect",
+        "_BUILT",
+    )
+
+    # Shared by every GUI element, refreshed by pyguilib.update once per frame and dropped by invalidate_display.
+    _cached_display_surface = None
+    _cached_display_size = None
+
     def __init__(
         self,
         draw_order: int = 0,
@@ -59,8 +162,8 @@ class PyGuiInstance(object):
         background_transparency: float = 255,
         border_color: Color = Color(0, 0, 0, 255),
         border_size: int = 0,
-        position: UDim2 = UDim2(0, 0, 0, 0),
-        size: UDim2 = UDim2(0, 0, 0, 0),
+        position: UDim2 = UDim2.of(0, 0, 0, 0),
+        size: UDim2 = UDim2.of(0, 0, 0, 0),
         anchor_point: Vector2 = Vector2(0, 0),
         layout_order: int = 0,
         parent: Optional["PyGuiInstance"] = None,
@@ -81,6 +184,11 @@ class PyGuiInstance(object):
         self._size = size
         self._anchor_point = anchor_point
 
+        # Only the geometry properties can be overrided (by the layouts), each one has its own slot.
+        self._position_override = _UNSET
+        self._size_override = _UNSET
+        self._anchor_point_override = _UNSET
+
         self._layout_order = layout_order
 
         self._parent = parent
@@ -88,53 +196,60 @@ class PyGuiInstance(object):
         self.__instance_updaters = []
         self.__instance_drawers = []
 
-        self._name = name or f'Child_{str(uuid.uuid4()).replace("-", "_")}'
+        self._name = name or f"Child_{next(_unnamed_instances_counter)}"
 
-        self._childrens = {}
-        self._properties_listeners = {}
-        self._properties_overrides = {}
+        self._childrens = _EMPTY_DICT
+        self._properties_listeners = _EMPTY_DICT
 
         self.__instance_depth = 0
 
-        self.child_added = PyGuiSignal()
-        self.child_removed = PyGuiSignal()
+        # Filled on first access, dropped by _invalidate_absolute_geometry.
+        self._absolute_position = None
+        self._absolute_size = None
 
-        self.mouse_moved = PyGuiSignal()
+        # Inserted into the root quadtree by build, inherited from the parent so it stays None outside of a PyGui tree.
+        self._root_quadtree_reference = None
+        self._quadtree_item = None
 
-        self.mouse_entered = PyGuiSignal()
-        self.mouse_leaving = PyGuiSignal()
+        # Background surface of the instance and the properties it was rendered from, only compared again once stale.
+        self._surface = None
+        self._surface_key = None
+        self._surface_stale = True
 
-        self.mouse_button_down = PyGuiSignal()
-        self.mouse_button_up = PyGuiSignal()
+        # Rect of the display covered by what the drawers returned last, they may draw past the absolute rect.
+        self._drawn_extent = None
 
-        self._register_property_change_listener("visible", lambda _: self.visible)
-        self._register_property_change_listener("draw_order", lambda _: self.draw_order)
-        self._register_property_change_listener("background_color", lambda _: self.background_color)
-        self._register_property_change_listener("border_color", lambda _: self.border_color)
-        self._register_property_change_listener("background_transparency", lambda _: self.background_transparency)
-        self._register_property_change_listener("border_size", lambda _: self.border_size)
-        self._register_property_change_listener("position", lambda _: self.position)
-        self._register_property_change_listener("size", lambda _: self.size)
-        self._register_property_change_listener("anchor_point", lambda _: self.anchor_point)
+        self.child_added = PyGuiSignal()
+        self.child_removed = PyGuiSignal()
 
         super(PyGuiInstance, self).__init__()
 
-        def _sort_childrens(*_):
-            self._childrens = dict(
-                sorted(
-                    self._childrens.items(),
-                    key=lambda item: item[1].draw_order,
-                )
-            )
+        # Childrens in drawing order, _childrens stays a plain dict for the lookups by name.
+        self._sorted_childrens = []
 
-        self.child_added.connect(_sort_childrens)
-        self.child_removed.connect(_sort_childrens)
+        # Built by _get_flattened_subtree, dropped whenever a drawing order below this instance changes.
+        self._flattened_subtree = None
 
-        _sort_childrens()
+        self.child_added.connect(self._insert_sorted_child)
+        self.child_removed.connect(self._remove_sorted_child)
 
         self._BLOCKING_SCREEN_BUFFER_UPDATE = 0
+
+        # Subtree rect from when BLOCKING_SCREEN_BUFFER_UPDATE blocked the childrens, redrawn once they are unblocked.
+        self._blocked_subtree_rect = None
+
         self._BUILT = False
 
+    def __getattr__(self, name: str) -> Any:
+        # Only reached when the attribute was never set.
+        if name in LAZILY_CREATED_SIGNALS:
+            signal = PyGuiSignal()
+            setattr(self, name, signal)
+
+            return signal
+
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
     def __setitem__(self, key: str, value: Any):
         setattr(self, key, value)
 
@@ -149,36 +264,219 @@ class PyGuiInstance(object):
 
     def _update_screen_buffer(original_caller: Callable[["PyGuiInstance", Any], None], *_) -> Callable[[Any], None]:
         def decorator(self: "PyGuiInstance", *kwargs):
+            # BLOCKING_SCREEN_BUFFER_UPDATE inlined, every setter goes through this check. Blocked setters mark nothing, lifting
+            # the block redraws the whole subtree of the parent instead.
+            parent = self._parent
+            if not self._BUILT or (parent is not None and parent._BLOCKING_SCREEN_BUFFER_UPDATE > 0):
+                original_caller(self, *kwargs)
+                return
+
+            # Both where the GUI element (and its childrens) was and where it is now have to be redrawn.
+            previous_subtree_rect = self._get_subtree_rect()
             original_caller(self, *kwargs)
-
-            if self._BUILT and not self.BLOCKING_SCREEN_BUFFER_UPDATE:
-                self._parent.clear()
-                self._parent.draw()
+            self._mark_dirty(previous_subtree_rect.union(self._get_subtree_rect(True)))
 
         return decorator
 
-    def _invoke_property_change_listener(self, property_name: str):
-        assert property_name in self._properties_listeners, f"Property {property_name} is not registered"
-        self._properties_listeners[property_name].fire()
+    def _get_absolute_rect(self) -> Rect:
+        (absolute_x_position, absolute_y_position) = self.absolute_position
+        (absolute_width, absolute_height) = self.absolute_size
 
-    def _register_property_change_listener(self, property_name: str, callback: Callable[[Any], Any]):
-        assert property_name not in self._properties_listeners, f"Property {property_name} is already registered"
+        # Rounded outwards (and one pixel further), the fractional positions are rounded when the surfaces are blitted.
+        left = math.floor(absolute_x_position)
+        top = math.floor(absolute_y_position)
 
-        property_event = PyGuiSignal()
-        property_event.connect(callback)
+        return Rect(left, top, math.ceil(absolute_x_position + absolute_width) - left + 1, math.ceil(absolute_y_position + absolute_height) - top + 1)
+
+    def _get_drawn_rect(self, refresh_drawn_extent: bool = False) -> Rect:
+        absolute_rect = self._get_absolute_rect()
+
+        if not self.__instance_drawers:
+            return absolute_rect
+
+        # The drawn extent is what is on the display until the next redraw, refreshed it is what the next redraw draws.
+        if refresh_drawn_extent and self._visible:
+            self._run_instance_drawers()
+
+        drawn_extent = self._drawn_extent
+
+        return absolute_rect if drawn_extent is None else absolute_rect.union(drawn_extent)
+
+    def _get_subtree_rect(self, refresh_drawn_extents: bool = False) -> Rect:
+        # Childrens are not clipped to their parent, they may reach outside of it.
+        (flattened_instances, _) = self._get_flattened_subtree()
+
+        if len(flattened_instances) == 1:
+            return self._get_drawn_rect(refresh_drawn_extents)
+
+        return self._get_drawn_rect(refresh_drawn_extents).unionall([instance._get_drawn_rect(refresh_drawn_extents) for instance in flattened_instances])
+
+    def _request_redraw(self):
+        # What is drawn now may not cover what was drawn before (a shorter text), both have to be redrawn.
+        previous_subtree_rect = self._get_subtree_rect()
+        self._mark_dirty(previous_subtree_rect.union(self._get_subtree_rect(True)))
+
+    def _run_instance_drawers(self) -> List[Tuple[Surface, Vector2]]:
+        instance_blit_sequence = []
 
-        self._properties_listeners[property_name] = property_event
+        for instance_drawer in self.__instance_drawers:
+            drawer_blit_sequence = instance_drawer()
 
-    def _get_overrided_property(self, property_name: str) -> Any:
-        return self._properties_overrides.get(property_name, None)
+            if drawer_blit_sequence:
+                instance_blit_sequence.extend(drawer_blit_sequence)
+
+        self._drawn_extent = _get_blit_sequence_extent(instance_blit_sequence)
+
+        return instance_blit_sequence
+
+    def _mark_dirty(self, rect: Rect):
+        # Redrawn by flush_pending_redraws on the next update, from the root so everything overlapping the rect is redrawn.
+        root = self
+
+        while root._parent is not None:
+            root = root._parent
+
+        root_dirty_rects = _dirty_rects.get(root)
+
+        if root_dirty_rects is None:
+            _dirty_rects[root] = [rect]
+        else:
+            root_dirty_rects.append(rect)
+
+    def _has_pending_redraws(self) -> bool:
+        # Only roots have pending redraws, _mark_dirty files them under the root of the GUI element.
+        return self in _dirty_rects
+
+    def _invoke_property_change_listener(self, property_name: str, value: Any):
+        # The signals are only created once something connects to them, until then there is nobody to notify.
+        property_event = self._properties_listeners.get(property_name)
+
+        if property_event is not None:
+            property_event.fire(value)
+
+    def _register_property_change_listener(self, property_name: str, callback: Callable[[Any], Any]) -> PyGuiSignal:
+        property_event = self.get_property_changed_signal(property_name)
+        property_event.connect(callback)
+
+        return property_event
 
     @_update_screen_buffer
     def _add_property_override(self, property_name: str, value: Any):
-        self._properties_overrides[property_name] = value
+        if property_name not in ABSOLUTE_GEOMETRY_PROPERTIES:
+            raise Exception(f"{property_name} can not be overrided")
+
+        setattr(self, f"_{property_name}_override", value)
+        self._invalidate_absolute_geometry()
 
     @_update_screen_buffer
     def _remove_property_override(self, property_name: str):
-        del self._properties_overrides[property_name]
+        if property_name not in ABSOLUTE_GEOMETRY_PROPERTIES:
+            raise Exception(f"{property_name} can not be overrided")
+
+        setattr(self, f"_{property_name}_override", _UNSET)
+        self._invalidate_absolute_geometry()
+
+    def _insert_sorted_child(self, child: "PyGuiInstance"):
+        bisect.insort(self._sorted_childrens, child, key=_get_draw_order)
+        self._invalidate_flattened_subtree()
+
+    def _remove_sorted_child(self, child: "PyGuiInstance"):
+        sorted_childrens = self._sorted_childrens
+
+        # Binary search the run of childrens sharing the same draw order and only scan that run.
+        index = bisect.bisect_left(sorted_childrens, child.draw_order, key=_get_draw_order)
+
+        while index < len(sorted_childrens) and sorted_childrens[index] is not child:
+            index += 1
+
+        if index < len(sorted_childrens):
+            del sorted_childrens[index]
+            self._invalidate_flattened_subtree()
+
+    def _invalidate_flattened_subtree(self):
+        # The flattened subtree of every ancestor contains the one of this instance.
+        instance = self
+
+        while instance is not None:
+            instance._flattened_subtree = None
+            instance = instance._parent
+
+    def _get_flattened_subtree(self) -> Tuple[List["PyGuiInstance"], List[int]]:
+        """
+        Get this instance and all of its descendants in drawing order (pre-order), so they can be walked without recursion.
+
+        Returns:
+            Tuple[List[PyGuiInstance], List[int]]: The instances, and for each one the index right after its subtree.
+        """
+        if self._flattened_subtree is None:
+            flattened_instances = []
+            subtree_ends = []
+
+            # None entries close the subtree of the instance at the index pushed along with them.
+            pending_instances = [self]
+
+            while pending_instances:
+                instance = pending_instances.pop()
+
+                if instance is None:
+                    subtree_ends[pending_instances.pop()] = len(flattened_instances)
+                    continue
+
+                pending_instances.append(len(flattened_instances))
+                pending_instances.append(None)
+
+                flattened_instances.append(instance)
+                subtree_ends.append(0)
+
+                pending_instances.extend(reversed(instance._sorted_childrens))
+
+            self._flattened_subtree = (flattened_instances, subtree_ends)
+
+        return self._flattened_subtree
+
+    def _invalidate_absolute_geometry(self):
+        # The absolute geometry of every descendant is derived from this one.
+        pending_instances = [self]
+
+        while pending_instances:
+            instance = pending_instances.pop()
+
+            instance._absolute_position = None
+            instance._absolute_size = None
+            instance._surface_stale = True
+
+            if instance._quadtree_item is not None:
+                _moved_instances[instance] = None
+
+            pending_instances.extend(instance._childrens.values())
+
+    @contextmanager
+    def _block_childs_screen_buffer_updates(self):
+        # Every child reads its BLOCKING_SCREEN_BUFFER_UPDATE from this counter, bumping it blocks all of them at once.
+        self._BLOCKING_SCREEN_BUFFER_UPDATE += 1
+
+        try:
+            yield
+        finally:
+            self._BLOCKING_SCREEN_BUFFER_UPDATE -= 1
+
+    @contextmanager
+    def _defer_redraws(self):
+        # Blocks the redraws requested by this instance (and its siblings), a single one is requested once done.
+        if self._parent is None:
+            yield
+            return
+
+        previous_subtree_rect = self._get_subtree_rect() if self._BUILT else None
+
+        with self._parent._block_childs_screen_buffer_updates():
+            yield
+
+        if self._BUILT and not self.BLOCKING_SCREEN_BUFFER_UPDATE:
+            self._parent._request_redraw()
+
+            if previous_subtree_rect is not None:
+                self._mark_dirty(previous_subtree_rect)
 
     def _get_drawable_surface(self) -> Surface:
         """
@@ -187,7 +485,34 @@ class PyGuiInstance(object):
         Returns:
             Surface: The drawable surface.
         """
-        return pygame.display.get_surface()
+        return PyGuiInstance._get_display_surface()
+
+    @staticmethod
+    def _get_display_surface() -> Surface:
+        if PyGuiInstance._cached_display_surface is None:
+            PyGuiInstance._cache_display_surface(pygame.display.get_surface())
+
+        return PyGuiInstance._cached_display_surface
+
+    @staticmethod
+    def _get_display_size() -> Tuple[int, int]:
+        if PyGuiInstance._cached_display_size is None:
+            PyGuiInstance._cache_display_surface(pygame.display.get_surface())
+
+        return PyGuiInstance._cached_display_size
+
+    @staticmethod
+    def _cache_display_surface(display_surface: Surface):
+        PyGuiInstance._cached_display_surface = display_surface
+        PyGuiInstance._cached_display_size = display_surface.get_size()
+
+    @staticmethod
+    def invalidate_display():
+        """
+        Drop the cached display surface, call it after the display mode was changed outside of pyguilib.update.
+        """
+        PyGuiInstance._cached_display_surface = None
+        PyGuiInstance._cached_display_size = None
 
     def build(self) -> "PyGuiInstance":
         """
@@ -203,20 +528,22 @@ class PyGuiInstance(object):
         if not self._parent:
             print(f"{self._name} was not added to any parent")
         else:
+            if self._parent._childrens is _EMPTY_DICT:
+                self._parent._childrens = {}
+
             self._parent._childrens[self._name] = self
 
-            try:
-                self._root_quadtree_reference = getattr(self._parent, "_root_quadtree_reference")
-            except AttributeError:
-                pass
+            self._root_quadtree_reference = self._parent._root_quadtree_reference
 
             self.__instance_depth = self._parent.__instance_depth + 1
 
-            self._root_quadtree_reference.insert(QuadTreeItem(self, lambda: self.absolute_position, lambda: self.absolute_size))
+            if self._root_quadtree_reference is not None:
+                self._quadtree_item = QuadTreeItem(self, lambda: self.absolute_position, lambda: self.absolute_size)
+                self._root_quadtree_reference.insert(self._quadtree_item)
+
             self._parent.child_added.fire(self)
 
-            self.clear()
-            self.draw()
+            self._request_redraw()
 
             self._BUILT = True
 
@@ -230,10 +557,18 @@ class PyGuiInstance(object):
             property_name (str): The name of the property.
 
         Returns:
-            PyGuiSignal: The signal for the property change.
+            PyGuiSignal: The signal for the property change, fired with the new value of the property.
         """
-        assert property_name in self._properties_listeners, f"Property {property_name} is not registered"
-        return self._properties_listeners[property_name]
+        property_event = self._properties_listeners.get(property_name)
+
+        if property_event is None:
+            assert isinstance(getattr(type(self), property_name, None), property), f"Property {property_name} does not exist"
+            if self._properties_listeners is _EMPTY_DICT:
+                self._properties_listeners = {}
+
+            property_event = self._properties_listeners[property_name] = PyGuiSignal()
+
+        return property_event
 
     @property
     def BLOCKING_SCREEN_BUFFER_UPDATE(self) -> bool:
@@ -243,12 +578,34 @@ class PyGuiInstance(object):
         Returns:
             bool: Whether screen buffer updates are blocked.
         """
-        return self._parent._BLOCKING_SCREEN_BUFFER_UPDATE > 0
+        return self._parent is not None and self._parent._BLOCKING_SCREEN_BUFFER_UPDATE > 0
 
     @BLOCKING_SCREEN_BUFFER_UPDATE.setter
-    @_update_screen_buffer
     def BLOCKING_SCREEN_BUFFER_UPDATE(self, value: bool):
-        self._parent._BLOCKING_SCREEN_BUFFER_UPDATE = max(0, self._parent._BLOCKING_SCREEN_BUFFER_UPDATE + (1 if value else -1))
+        parent = self._parent
+        if parent is None:
+            return
+
+        blocking_count = parent._BLOCKING_SCREEN_BUFFER_UPDATE
+
+        if value:
+            # The setters called while blocked mark nothing, what is on the display now is redrawn once unblocked.
+            if blocking_count == 0 and self._BUILT:
+                parent._blocked_subtree_rect = parent._get_subtree_rect()
+
+            parent._BLOCKING_SCREEN_BUFFER_UPDATE = blocking_count + 1
+        elif blocking_count > 0:
+            parent._BLOCKING_SCREEN_BUFFER_UPDATE = blocking_count - 1
+
+            if blocking_count == 1:
+                blocked_subtree_rect = parent._blocked_subtree_rect
+                parent._blocked_subtree_rect = None
+
+                if blocked_subtree_rect is not None:
+                    parent._mark_dirty(blocked_subtree_rect)
+
+                if self._BUILT:
+                    parent._request_redraw()
 
     @property
     def visible(self) -> bool:
@@ -264,7 +621,7 @@ class PyGuiInstance(object):
     @_update_screen_buffer
     def visible(self, value: bool):
         self._visible = value
-        self._invoke_property_change_listener("visible")
+        self._invoke_property_change_listener("visible", value)
 
     @property
     def draw_order(self) -> int:
@@ -279,8 +636,18 @@ class PyGuiInstance(object):
     @draw_order.setter
     @_update_screen_buffer
     def draw_order(self, value: int):
+        parent = self._parent
+        sorted_in_parent = parent is not None and self in parent._sorted_childrens
+
+        if sorted_in_parent:
+            parent._remove_sorted_child(self)
+
         self._draw_order = value
-        self._invoke_property_change_listener("draw_order")
+
+        if sorted_in_parent:
+            parent._insert_sorted_child(self)
+
+        self._invoke_property_change_listener("draw_order", value)
 
     @property
     def background_color(self) -> Color:
@@ -296,7 +663,8 @@ class PyGuiInstance(object):
     @_update_screen_buffer
     def background_color(self, value: Color):
         self._background_color = value
-        self._invoke_property_change_listener("background_color")
+        self._surface_stale = True
+        self._invoke_property_change_listener("background_color", value)
 
     @property
     def border_color(self) -> Color:
@@ -312,7 +680,8 @@ class PyGuiInstance(object):
     @_update_screen_buffer
     def border_color(self, value: Color):
         self._border_color = value
-        self._invoke_property_change_listener("border_color")
+        self._surface_stale = True
+        self._invoke_property_change_listener("border_color", value)
 
     @property
     def background_transparency(self) -> float:
@@ -328,7 +697,8 @@ class PyGuiInstance(object):
     @_update_screen_buffer
     def background_transparency(self, value: float) -> float:
         self._background_transparency = value
-        self._invoke_property_change_listener("background_transparency")
+        self._surface_stale = True
+        self._invoke_property_change_listener("background_transparency", value)
 
     @property
     def border_size(self) -> int:
@@ -344,7 +714,8 @@ class PyGuiInstance(object):
     @_update_screen_buffer
     def border_size(self, value: int):
         self._border_size = value
-        self._invoke_property_change_listener("border_size")
+        self._surface_stale = True
+        self._invoke_property_change_listener("border_size", value)
 
     @property
     def position(self) -> UDim2:
@@ -354,29 +725,44 @@ class PyGuiInstance(object):
         Returns:
             UDim2: The position of the GUI element.
         """
-        return self._get_overrided_property("position") or self._position
+        return self._position if self._position_override is _UNSET else self._position_override
 
     @position.setter
     @_update_screen_buffer
     def position(self, value: UDim2):
         self._position = value
-        self._invoke_property_change_listener("position")
+        self._invalidate_absolute_geometry()
+        self._invoke_property_change_listener("position", value)
 
     @property
-    def absolute_position(self) -> Vector2:
+    def absolute_position(self) -> _XY:
         """
         Property for getting the absolute position of the GUI element.
 
         Returns:
-            Vector2: The absolute position of the GUI element.
+            Tuple[float, float]: The absolute position of the GUI element, as an (x, y) named tuple.
         """
-        parent_absolute_position = self.parent.absolute_position if self.parent else Vector2(0, 0)
-        parent_absolute_size = self.parent.absolute_size if self.parent else Vector2(*pygame.display.get_surface().get_size())
+        if self._absolute_position is None:
+            parent = self._parent
 
-        return Vector2(
-            (parent_absolute_position.x + parent_absolute_size.x * self.position.x.scale + self.position.x.offset) - self.absolute_size.x * self.anchor_point.x,
-            (parent_absolute_position.y + parent_absolute_size.y * self.position.y.scale + self.position.y.offset) - self.absolute_size.y * self.anchor_point.y,
-        )
+            if parent:
+                (parent_absolute_x_position, parent_absolute_y_position) = parent.absolute_position
+                (parent_absolute_width, parent_absolute_height) = parent.absolute_size
+            else:
+                (parent_absolute_x_position, parent_absolute_y_position) = (0, 0)
+                (parent_absolute_width, parent_absolute_height) = PyGuiInstance._get_display_size()
+
+            (absolute_width, absolute_height) = self.absolute_size
+
+            (position_x, position_y) = self.position.resolve(parent_absolute_width, parent_absolute_height)
+            (anchor_x, anchor_y) = self.anchor_point
+
+            self._absolute_position = _XY(
+                parent_absolute_x_position + position_x - absolute_width * anchor_x,
+                parent_absolute_y_position + position_y - absolute_height * anchor_y,
+            )
+
+        return self._absolute_position
 
     @property
     def size(self) -> UDim2:
@@ -386,28 +772,34 @@ class PyGuiInstance(object):
         Returns:
             UDim2: The size of the GUI element.
         """
-        return self._get_overrided_property("size") or self._size
+        return self._size if self._size_override is _UNSET else self._size_override
 
     @size.setter
     @_update_screen_buffer
     def size(self, size: UDim2):
         self._size = size
-        self._invoke_property_change_listener("size")
+        self._invalidate_absolute_geometry()
+        self._invoke_property_change_listener("size", size)
 
     @property
-    def absolute_size(self) -> Vector2:
+    def absolute_size(self) -> _XY:
         """
         Property for getting the absolute size of the GUI element.
 
         Returns:
-            Vector2: The absolute size of the GUI element.
+            Tuple[float, float]: The absolute size of the GUI element, as an (x, y) named tuple.
         """
-        parent_absolute_size = self.parent.absolute_size if self.parent else Vector2(*pygame.display.get_surface().get_size())
+        if self._absolute_size is None:
+            parent = self._parent
+
+            if parent:
+                (parent_absolute_width, parent_absolute_height) = parent.absolute_size
+            else:
+                (parent_absolute_width, parent_absolute_height) = PyGuiInstance._get_display_size()
 
-        return Vector2(
-            parent_absolute_size.x * self.size.x.scale + self.size.x.offset,
-            parent_absolute_size.y * self.size.y.scale + self.size.y.offset,
-        )
+            self._absolute_size = _XY._make(self.size.resolve(parent_absolute_width, parent_absolute_height))
+
+        return self._absolute_size
 
     @property
     def anchor_point(self) -> Vector2:
@@ -417,13 +809,14 @@ class PyGuiInstance(object):
         Returns:
             Vector2: The anchor point of the GUI element.
         """
-        return self._get_overrided_property("anchor_point") or self._anchor_point
+        return self._anchor_point if self._anchor_point_override is _UNSET else self._anchor_point_override
 
     @anchor_point.setter
     @_update_screen_buffer
     def anchor_point(self, value: Vector2):
         self._anchor_point = value
-        self._invoke_property_change_listener("anchor_point")
+        self._invalidate_absolute_geometry()
+        self._invoke_property_change_listener("anchor_point", value)
 
     @property
     def layout_order(self) -> int:
@@ -438,7 +831,7 @@ class PyGuiInstance(object):
     @layout_order.setter
     def layout_order(self, value: int):
         self._layout_order = value
-        self._invoke_property_change_listener("layout_order")
+        self._invoke_property_change_listener("layout_order", value)
 
     @property
     def parent(self) -> Optional["PyGuiInstance"]:
@@ -475,11 +868,23 @@ class PyGuiInstance(object):
         Parameters:
             events (List[Event]): The events to update the GUI element with.
         """
-        for instance_updater in self.__instance_updaters:
-            instance_updater(events)
+        (flattened_instances, subtree_ends) = self._get_flattened_subtree()
+
+        index = 0
+        flattened_instances_count = len(flattened_instances)
 
-        for child in self._childrens.values():
-            child.update(events)
+        while index < flattened_instances_count:
+            instance = flattened_instances[index]
+
+            # Hidden GUI elements are not updated, along with their whole subtree.
+            if not instance._visible:
+                index = subtree_ends[index]
+                continue
+
+            index += 1
+
+            for instance_updater in instance.__instance_updaters:
+                instance_updater(events)
 
     def clear(self):
         """
@@ -487,36 +892,176 @@ class PyGuiInstance(object):
         """
         pass
 
+    def _collect_blit_sequence(self, blit_sequence: List[Tuple[Surface, Vector2]], region: Rect):
+        """
+        Collect the surfaces of the GUI element and its childrens overlapping the region, in drawing order.
+
+        Parameters:
+            blit_sequence (List[Tuple[Surface, Vector2]]): The sequence to append the (surface, position) pairs to.
+            region (Rect): The region of the display being drawn.
+        """
+        (region_left, region_top, region_right, region_bottom) = (region.left, region.top, region.right, region.bottom)
+
+        (flattened_instances, subtree_ends) = self._get_flattened_subtree()
+
+        index = 0
+        flattened_instances_count = len(flattened_instances)
+
+        while index < flattened_instances_count:
+            instance = flattened_instances[index]
+
+            if instance is not self:
+                instance.clear()
+
+            if not instance.visible:
+                index = subtree_ends[index]
+                continue
+
+            # Childrens are not clipped to their parent, so they are still visited when their parent is culled.
+            index += 1
+
+            absolute_position = instance.absolute_position
+            absolute_size = instance.absolute_size
+
+            (absolute_x_position, absolute_y_position) = absolute_position
+            (absolute_width, absolute_height) = absolute_size
+
+            # Only the background is culled by the absolute rect, the drawers are culled by what they return.
+            if (
+                absolute_width > 0
+                and absolute_height > 0
+                and absolute_x_position < region_right
+                and absolute_y_position < region_bottom
+                and absolute_x_position + absolute_width > region_left
+                and absolute_y_position + absolute_height > region_top
+            ):
+                # Only the setters of the properties the background is rendered from (and the geometry) mark it as stale,
+                # the properties are then compared in case they were set to the same values.
+                if instance._surface_stale:
+                    surface_key = (
+                        absolute_size,
+                        tuple(instance.background_color),
+                        instance.background_transparency,
+                        tuple(instance.border_color),
+                        instance.border_size,
+                    )
+
+                    if surface_key != instance._surface_key:
+                        # Every pixel is filled again below, the surface only has to be allocated again for a new size.
+                        if instance._surface is None or instance._surface_key[0] != absolute_size:
+                            instance._surface = Surface(absolute_size, SRCALPHA)
+
+                        # The transparency is baked into the colors, the surface keeps blending per pixel only.
+                        background_color = _bake_transparency(instance.background_color, instance.background_transparency)
+
+                        if instance.border_size > 0:
+                            # One pixel wider than border_size, which is what the borders always looked like.
+                            border_width = instance.border_size + 1
+
+                            # Filling the inner rect over the border color is two plain fills, nothing has to be rasterized.
+                            instance._surface.fill(_bake_transparency(instance.border_color, instance.background_transparency))
+                            instance._surface.fill(
+                                background_color,
+                                (border_width, border_width, max(0, absolute_width - 2 * border_width), max(0, absolute_height - 2 * border_width)),
+                            )
+                        else:
+                            instance._surface.fill(background_color)
+
+                        instance._surface_key = surface_key
+
+                    instance._surface_stale = False
+
+                blit_sequence.append((instance._surface, absolute_position))
+
+            if instance.__instance_drawers:
+                instance_blit_sequence = instance._run_instance_drawers()
+
+                if instance_blit_sequence and instance._drawn_extent.colliderect(region):
+                    blit_sequence.extend(instance_blit_sequence)
+
     def draw(self):
         """
         Draw the GUI element on the screen.
+
+        Note:
+            The GUI element and all of its childrens are drawn with a single blits call, so instance drawers
+            must return their (surface, position) pairs instead of blitting them directly.
         """
         if self.visible:
-            self._surface = Surface(self.absolute_size, SRCALPHA)
-
-            self._surface.set_alpha(self.background_transparency)
-            self._surface.fill(self.background_color)
-
-            if self.border_size > 0:
-                for x in range(2):
-                    for y in range(2):
-                        pygame.draw.rect(
-                            self._surface,
-                            self.border_color,
-                            (
-                                x,
-                                y,
-                                self.absolute_size.x - x * 2,
-                                self.absolute_size.y - y * 2,
-                            ),
-                            self.border_size,
-                        )
-
-            self._get_drawable_surface().blit(self._surface, self.absolute_position)
-
-            for instance_drawer in self.__instance_drawers:
-                instance_drawer()
-
-            for child in self._childrens.values():
-                child.clear()
-                child.draw()
+            self._draw_region(Rect((0, 0), PyGuiInstance._get_display_size()))
+
+    def _draw_region(self, region: Rect):
+        drawable_surface = self._get_drawable_surface()
+
+        blit_sequence = []
+        self._collect_blit_sequence(blit_sequence, region)
+
+        # Clipped so the GUI elements only partially inside of the region do not draw over what is outside of it.
+        previous_clip = drawable_surface.get_clip()
+        drawable_surface.set_clip(region)
+
+        try:
+            drawable_surface.blits(blit_sequence, doreturn=False)
+        finally:
+            drawable_surface.set_clip(previous_clip)
+
+
+def flush_moved_instances():
+    """
+    Reinserts the quadtree item of every GUI element moved since the last call, so hit tests find them where they are now.
+
+    Note:
+        Any number of moves of a GUI element between two calls costs a single reinsertion.
+    """
+    if not _moved_instances:
+        return
+
+    moved_instances = list(_moved_instances)
+    _moved_instances.clear()
+
+    for instance in moved_instances:
+        instance._root_quadtree_reference.remove(instance._quadtree_item)
+        instance._root_quadtree_reference.insert(instance._quadtree_item)
+
+
+def flush_pending_redraws() -> List[Rect]:
+    """
+    Redraws every rect of the display marked as dirty since the last call, once.
+
+    Returns:
+        List[Rect]: The rects of the display that were redrawn, they can be passed to pygame.display.update.
+
+    Note:
+        Overlapping rects are merged first, so no part of the display is drawn twice.
+    """
+    if not _dirty_rects:
+        return []
+
+    dirty_rects = list(_dirty_rects.items())
+    _dirty_rects.clear()
+
+    redrawn_rects = []
+
+    for root, root_dirty_rects in dirty_rects:
+        merged_rects = []
+
+        for rect in root_dirty_rects:
+            colliding_index = rect.collidelist(merged_rects)
+
+            while colliding_index != -1:
+                rect = rect.union(merged_rects.pop(colliding_index))
+                colliding_index = rect.collidelist(merged_rects)
+
+            merged_rects.append(rect)
+
+        if not root.visible:
+            continue
+
+        root.clear()
+
+        for rect in merged_rects:
+            root._draw_region(rect)
+
+        redrawn_rects.extend(merged_rects)
+
+    return redrawn_rects
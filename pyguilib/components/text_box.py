@@ -59,6 +59,30 @@ class TextBox(TextLabel, PyGuiInstance):
         cursor_position (int): The current cursor position.
     """
 
+    __slots__ = (
+        "_placeholder_text",
+        "_placeholder_text_color",
+        "_placeholder_text_transparency",
+        "_placeholder_text_font",
+        "_original_text_color",
+        "_original_text_transparency",
+        "_original_text_font",
+        "_applying_placeholder_style",
+        "_text_editable",
+        "_clear_text_on_focus_lost",
+        "_selection_color",
+        "_selection_transparency",
+        "_selection_start",
+        "_selection_end",
+        "_cursor_appeareance",
+        "_cursor_blink_interval",
+        "_cursor_position",
+        "_furthest_cursor_position",
+        "_is_focused",
+        "focus_gained",
+        "focus_lost",
+    )
+
     def __init__(self, **kwargs) -> "TextBox":
         super(TextBox, self).__init__(
             **kwargs,
@@ -82,14 +106,6 @@ class TextBox(TextLabel, PyGuiInstance):
         self.focus_gained = PyGuiSignal()
         self.focus_lost = PyGuiSignal()
 
-        self._register_property_change_listener("placeholder_text", lambda _: self.placeholder_text)
-        self._register_property_change_listener("placeholder_text_color", lambda _: self.placeholder_text_color)
-        self._register_property_change_listener("placeholder_text_transparency", lambda _: self.placeholder_text_transparency)
-        self._register_property_change_listener("placeholder_text_font", lambda _: self.placeholder_text_font)
-
-        self._register_property_change_listener("text_editable", lambda _: self.text_editable)
-        self._register_property_change_listener("clear_text_on_focus_lost", lambda _: self.clear_text_on_focus_lost)
-
         self._original_text_color = self._text_color
         self._original_text_transparency = self._text_transparency
         self._original_text_font = self._text_font
@@ -99,9 +115,13 @@ class TextBox(TextLabel, PyGuiInstance):
         self.text_transparency = self._placeholder_text_transparency
         self.text_font = self._placeholder_text_font
 
+        # Set while the placeholder style is applied, which must not overwrite the original style.
+        self._applying_placeholder_style = False
+
         def _update_original_property_value(key: str) -> Callable[[Any], None]:
             def wrapper(value: Any):
-                setattr(self, key, value)
+                if not self._applying_placeholder_style:
+                    setattr(self, key, value)
 
             return wrapper
 
@@ -117,91 +137,96 @@ class TextBox(TextLabel, PyGuiInstance):
 
         self._is_focused = False
 
-        def _text_box_mouse_interaction(*_):
-            self.capture_focus()
+        def on_backspace_pressed(event: Event):
+            if event.type != pygame.KEYDOWN:
+                return ActionResult.PASS
 
-        def _text_box_focus_gained(*_):
-            self._is_focused = True
+            if self._cursor_position == 0:
+                return ActionResult.SINK
 
-            self.text_color = self._original_text_color
-            self.text_transparency = self._original_text_transparency
-            self.text_font = self._original_text_font
+            self._splice_text(self._cursor_position - 1, self._cursor_position)
+            self._cursor_position -= 1
 
-            self._cursor_position = len(self._text)
+            return ActionResult.SINK
 
-            def on_backspace_pressed(event: Event):
-                if event.type != pygame.KEYDOWN:
-                    return ActionResult.PASS
+        def on_return_pressed(event: Event):
+            if event.type != pygame.KEYDOWN:
+                return ActionResult.PASS
 
-                if self._cursor_position == 0:
-                    return ActionResult.SINK
+            self._splice_text(self._cursor_position, self._cursor_position, "\n")
+            self._cursor_position += 1
 
-                self.text = self._text[: self._cursor_position - 1] + self._text[self._cursor_position :]
-                self._cursor_position -= 1
+            return ActionResult.SINK
 
-                return ActionResult.SINK
+        def on_left_arrow_pressed(event: Event):
+            if event.type != pygame.KEYDOWN:
+                return ActionResult.PASS
 
-            def on_return_pressed(event: Event):
-                if event.type != pygame.KEYDOWN:
-                    return ActionResult.PASS
+            self._cursor_position = max(0, self._cursor_position - 1)
+            return ActionResult.SINK
 
-                self.text = self.text[: self._cursor_position] + "\n" + "" if self._cursor_position == len(self.text) else self.text[self._cursor_position :]
-                self._cursor_position += 1
+        def on_right_arrow_pressed(event: Event):
+            if event.type != pygame.KEYDOWN:
+                return ActionResult.PASS
 
-                return ActionResult.SINK
+            self._cursor_position = min(len(self.text), self._cursor_position + 1)
+            return ActionResult.SINK
 
-            def on_left_arrow_pressed(event: Event):
-                if event.type != pygame.KEYDOWN:
-                    return ActionResult.PASS
+        def on_up_arrow_pressed(event: Event):
+            return ActionResult.SINK
 
-                self._cursor_position = max(0, self._cursor_position - 1)
-                return ActionResult.SINK
+        def on_down_arrow_pressed(event: Event):
+            return ActionResult.SINK
 
-            def on_right_arrow_pressed(event: Event):
-                if event.type != pygame.KEYDOWN:
-                    return ActionResult.PASS
+        def on_text_input(event: Event):
+            self._splice_text(self._cursor_position, self._cursor_position, event.unicode)
+            self._cursor_position += 1
+            return ActionResult.SINK
 
-                self._cursor_position = min(len(self.text), self._cursor_position + 1)
-                return ActionResult.SINK
+        # Built once, only bound to the action service while the TextBox is focused.
+        text_box_actions = (
+            ("backspace_pressed", on_backspace_pressed, [pygame.K_BACKSPACE], 0),
+            ("return_pressed", on_return_pressed, [pygame.K_RETURN], 0),
+            ("left_arrow_pressed", on_left_arrow_pressed, [pygame.K_LEFT], 0),
+            ("right_arrow_pressed", on_right_arrow_pressed, [pygame.K_RIGHT], 0),
+            ("up_arrow_pressed", on_up_arrow_pressed, [pygame.K_UP], 0),
+            ("down_arrow_pressed", on_down_arrow_pressed, [pygame.K_DOWN], 0),
+            ("text_input", on_text_input, [pygame.KEYDOWN], 10),
+        )
 
-            def on_up_arrow_pressed(event: Event):
-                return ActionResult.SINK
+        def _text_box_mouse_interaction(*_):
+            self.capture_focus()
 
-            def on_down_arrow_pressed(event: Event):
-                return ActionResult.SINK
+        def _text_box_focus_gained(*_):
+            self._is_focused = True
 
-            def on_text_input(event: Event):
-                self.text = self.text[: self._cursor_position] + event.unicode + self.text[self._cursor_position :]
-                self._cursor_position += 1
-                return ActionResult.SINK
+            self.text_color = self._original_text_color
+            self.text_transparency = self._original_text_transparency
+            self.text_font = self._original_text_font
 
-            action_service.bind_action("backspace_pressed", on_backspace_pressed, [pygame.K_BACKSPACE], priority=0, internal=True)
-            action_service.bind_action("return_pressed", on_return_pressed, [pygame.K_RETURN], priority=0, internal=True)
-            action_service.bind_action("left_arrow_pressed", on_left_arrow_pressed, [pygame.K_LEFT], priority=0, internal=True)
-            action_service.bind_action("right_arrow_pressed", on_right_arrow_pressed, [pygame.K_RIGHT], priority=0, internal=True)
-            action_service.bind_action("up_arrow_pressed", on_up_arrow_pressed, [pygame.K_UP], priority=0, internal=True)
-            action_service.bind_action("down_arrow_pressed", on_down_arrow_pressed, [pygame.K_DOWN], priority=0, internal=True)
-            action_service.bind_action("text_input", on_text_input, [pygame.KEYDOWN], priority=10, internal=True)
+            self._cursor_position = len(self._text)
+
+            for action_name, callback, events, priority in text_box_actions:
+                action_service.bind_action(action_name, callback, events, priority=priority, internal=True)
 
         def _text_box_focus_lost(*_):
             self._is_focused = False
 
+            self._applying_placeholder_style = True
+
             self.text_color = self._placeholder_text_color
             self.text_transparency = self._placeholder_text_transparency
             self.text_font = self._placeholder_text_font
 
+            self._applying_placeholder_style = False
+
             if self._clear_text_on_focus_lost:
                 self._text = self._placeholder_text
 
             self._cursor_position = 0
 
-            action_service.unbind_action("backspace_pressed")
-            action_service.unbind_action("return_pressed")
-            action_service.unbind_action("left_arrow_pressed")
-            action_service.unbind_action("right_arrow_pressed")
-            action_service.unbind_action("up_arrow_pressed")
-            action_service.unbind_action("down_arrow_pressed")
-            action_service.unbind_action("text_input")
+            for action_name, *_ in text_box_actions:
+                action_service.unbind_action(action_name)
 
         self.mouse_button_down.connect(_text_box_mouse_interaction)
 
@@ -252,7 +277,7 @@ class TextBox(TextLabel, PyGuiInstance):
     @PyGuiInstance._update_screen_buffer
     def placeholder_text(self, value: str):
         self._placeholder_text = value
-        self._invoke_property_change_listener("placeholder_text")
+        self._invoke_property_change_listener("placeholder_text", value)
 
     @property
     def placeholder_text_color(self) -> Color:
@@ -268,7 +293,7 @@ class TextBox(TextLabel, PyGuiInstance):
     @PyGuiInstance._update_screen_buffer
     def placeholder_text_color(self, value: Color):
         self._placeholder_text_color = value
-        self._invoke_property_change_listener("placeholder_text_color")
+        self._invoke_property_change_listener("placeholder_text_color", value)
 
     @property
     def placeholder_text_transparency(self) -> int:
@@ -284,7 +309,7 @@ class TextBox(TextLabel, PyGuiInstance):
     @PyGuiInstance._update_screen_buffer
     def placeholder_text_transparency(self, value: int):
         self._placeholder_text_transparency = value
-        self._invoke_property_change_listener("placeholder_text_transparency")
+        self._invoke_property_change_listener("placeholder_text_transparency", value)
 
     @property
     def placeholder_text_font(self) -> pygame.font.Font:
@@ -300,7 +325,7 @@ class TextBox(TextLabel, PyGuiInstance):
     @PyGuiInstance._update_screen_buffer
     def placeholder_text_font(self, value: pygame.font.Font):
         self._placeholder_text_font = value
-        self._invoke_property_change_listener("placeholder_text_font")
+        self._invoke_property_change_listener("placeholder_text_font", value)
 
     @property
     def text_editable(self) -> bool:
@@ -316,7 +341,7 @@ class TextBox(TextLabel, PyGuiInstance):
     @PyGuiInstance._update_screen_buffer
     def text_editable(self, value: bool):
         self._text_editable = value
-        self._invoke_property_change_listener("text_editable")
+        self._invoke_property_change_listener("text_editable", value)
 
     @property
     def clear_text_on_focus_lost(self) -> bool:
@@ -332,7 +357,7 @@ class TextBox(TextLabel, PyGuiInstance):
     @PyGuiInstance._update_screen_buffer
     def clear_text_on_focus_lost(self, value: bool):
         self._clear_text_on_focus_lost = value
-        self._invoke_property_change_listener("clear_text_on_focus_lost")
+        self._invoke_property_change_listener("clear_text_on_focus_lost", value)
 
     @property
     def selection_start(self) -> int:
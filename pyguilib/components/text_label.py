@@ -1,5 +1,6 @@
 from enum import Enum
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
 import pygame
 from pygame import Color, Vector2
@@ -43,6 +44,26 @@ text_y_alignment_offsets = [0, 0.5, 1]
 
 _circle_points_cache = {}
 
+# A TextBox switches between its placeholder and its typed text, both renders are kept so focus changes do not re-render.
+CACHED_TEXT_RENDERS_LIMIT = 2
+
+
+@lru_cache(maxsize=16)
+def _border_offsets(border_size: int) -> Tuple[Tuple[int, int], ...]:
+    # Where the border colored text is blitted to stroke the border, relative to the top left of the line surface.
+    return tuple((x + border_size, y + border_size) for x, y in _circle_points(border_size))
+
+
+@lru_cache(maxsize=256)
+def _render_text_line(font: pygame.font.Font, line: str, color: tuple) -> pygame.Surface:
+    # The rendered surface is shared between every TextLabel rendering the same line, it must never be drawn on.
+    return font.render(line, True, color).convert_alpha()
+
+
+@lru_cache(maxsize=256)
+def _measure_text_line(font: pygame.font.Font, line: str) -> Tuple[int, int]:
+    return font.size(line)
+
 
 # https://github.com/lordmauve/pgzero/blob/master/pgzero/ptext.py#L233
 def _circle_points(radius):
@@ -103,12 +124,26 @@ class TextLabel(PyGuiInstance):
         text_y_alignment (TextYAlignment): The text vertical alignment.
     """
 
+    __slots__ = (
+        "_text",
+        "_text_color",
+        "_text_transparency",
+        "_text_size",
+        "_text_font",
+        "_text_border_color",
+        "_text_border_size",
+        "_text_x_alignment",
+        "_text_y_alignment",
+        "_text_bounds",
+        "_cached_text_renders",
+    )
+
     def __init__(self, **kwargs) -> "TextLabel":
         super(TextLabel, self).__init__(
             **kwargs,
         )
 
-        self._text = [*kwargs.get("text", "TextLabel")]
+        self._text = kwargs.get("text", "TextLabel")
 
         self._text_color = kwargs.get("text_color", Color(255, 255, 255, 255))
         self._text_transparency = kwargs.get("text_transparency", 255)
@@ -123,17 +158,11 @@ class TextLabel(PyGuiInstance):
 
         self._text_bounds = Vector2(0, 0)
 
+        self._cached_text_renders = {}
+
         self._add_instance_updater_handler(self.__instance_updater)
         self._add_instance_drawer_handler(self.__instance_drawer)
 
-        self._register_property_change_listener("text", lambda _: self.text)
-        self._register_property_change_listener("text_color", lambda _: self.text_color)
-        self._register_property_change_listener("text_transparency", lambda _: self.text_transparency)
-        self._register_property_change_listener("text_size", lambda _: self.text_size)
-        self._register_property_change_listener("text_font", lambda _: self.text_font)
-        self._register_property_change_listener("text_x_alignment", lambda _: self.text_x_alignment)
-        self._register_property_change_listener("text_y_alignment", lambda _: self.text_y_alignment)
-
         def _update_dynamic_properties(*_):
             self.__recalculate_text_bounds()
 
@@ -152,9 +181,12 @@ class TextLabel(PyGuiInstance):
         max_text_width = 0
         max_text_height = 0
 
+        text_font = self.text_font
+        text_font_height = text_font.get_height()
+
         for line in self.text.split("\n"):
-            max_text_width = max(max_text_width, self.text_font.size(line)[0])
-            max_text_height += self.text_font.get_height()
+            max_text_width = max(max_text_width, _measure_text_line(text_font, line)[0])
+            max_text_height += text_font_height
 
         self._text_bounds = Vector2(max_text_width, max_text_height)
 
@@ -166,13 +198,19 @@ class TextLabel(PyGuiInstance):
         Returns:
             str: The current text content.
         """
-        return "".join(self._text)
+        return self._text
 
     @text.setter
     @PyGuiInstance._update_screen_buffer
     def text(self, value: str):
-        self._text = [*value]
-        self._invoke_property_change_listener("text")
+        self._text = value
+        self._invoke_property_change_listener("text", value)
+
+    @PyGuiInstance._update_screen_buffer
+    def _splice_text(self, start: int, end: int, inserted_text: str = ""):
+        # Replaces the characters between start and end, the text stays a plain string so reading it costs nothing.
+        self._text = self._text[:start] + inserted_text + self._text[end:]
+        self._invoke_property_change_listener("text", self._text)
 
     @property
     def text_color(self) -> Color:
@@ -188,7 +226,7 @@ class TextLabel(PyGuiInstance):
     @PyGuiInstance._update_screen_buffer
     def text_color(self, value: Color):
         self._text_color = value
-        self._invoke_property_change_listener("text_color")
+        self._invoke_property_change_listener("text_color", value)
 
     @property
     def text_transparency(self) -> int:
@@ -204,7 +242,7 @@ class TextLabel(PyGuiInstance):
     @PyGuiInstance._update_screen_buffer
     def text_transparency(self, value: int):
         self._text_transparency = value
-        self._invoke_property_change_listener("text_transparency")
+        self._invoke_property_change_listener("text_transparency", value)
 
     @property
     def text_size(self) -> int:
@@ -220,7 +258,7 @@ class TextLabel(PyGuiInstance):
     @PyGuiInstance._update_screen_buffer
     def text_size(self, value: int):
         self._text_size = value
-        self._invoke_property_change_listener("text_size")
+        self._invoke_property_change_listener("text_size", value)
 
     @property
     def text_font(self) -> pygame.font.Font:
@@ -236,7 +274,7 @@ class TextLabel(PyGuiInstance):
     @PyGuiInstance._update_screen_buffer
     def text_font(self, value: pygame.font.Font):
         self._text_font = value
-        self._invoke_property_change_listener("text_font")
+        self._invoke_property_change_listener("text_font", value)
 
     @property
     def text_border_color(self) -> Color:
@@ -252,7 +290,7 @@ class TextLabel(PyGuiInstance):
     @PyGuiInstance._update_screen_buffer
     def text_border_color(self, value: Color):
         self._text_border_color = value
-        self._invoke_property_change_listener("text_border_color")
+        self._invoke_property_change_listener("text_border_color", value)
 
     @property
     def text_border_size(self) -> int:
@@ -268,7 +306,7 @@ class TextLabel(PyGuiInstance):
     @PyGuiInstance._update_screen_buffer
     def text_border_size(self, value: int):
         self._text_border_size = value
-        self._invoke_property_change_listener("text_border_size")
+        self._invoke_property_change_listener("text_border_size", value)
 
     @property
     def text_x_alignment(self) -> TextXAlignment:
@@ -308,9 +346,16 @@ class TextLabel(PyGuiInstance):
         Returns:
             Vector2: The position of the text.
         """
-        return Vector2(
-            self.absolute_position.x + (self.absolute_size.x - self._text_bounds.x) * text_x_alignment_offsets[self._text_x_alignment.value],
-            self.absolute_position.y + (self.absolute_size.y - self._text_bounds.y) * text_y_alignment_offsets[self._text_y_alignment.value],
+        return Vector2(self._get_text_position())
+
+    def _get_text_position(self) -> Tuple[float, float]:
+        # Computed on every call rather than cached, the absolute geometry also changes with the ancestors of the TextLabel.
+        (absolute_x_position, absolute_y_position) = self.absolute_position
+        (absolute_width, absolute_height) = self.absolute_size
+
+        return (
+            absolute_x_position + (absolute_width - self._text_bounds.x) * text_x_alignment_offsets[self._text_x_alignment.value],
+            absolute_y_position + (absolute_height - self._text_bounds.y) * text_y_alignment_offsets[self._text_y_alignment.value],
         )
 
     @property
@@ -326,34 +371,65 @@ class TextLabel(PyGuiInstance):
     def __instance_updater(self, events: List[Event]):
         pass
 
-    def __instance_drawer(self):
-        text_lines = self.text.split("\n")
+    def __render_text_lines(self, text: str) -> list:
+        text_lines = text.split("\n")
         text_lines.reverse()
 
+        text_font = self._text_font
+        text_color = tuple(self._text_color)
+        text_border_color = tuple(self._text_border_color)
+        text_border_size = self._text_border_size
+        text_border_offsets = _border_offsets(text_border_size)
+
+        text_bounds_x = self._text_bounds.x
+        text_x_alignment_offset = text_x_alignment_offsets[self._text_x_alignment.value]
+
+        last_line_index = len(text_lines) - 1
+
+        rendered_text_lines = []
+
         for index, line in enumerate(text_lines):
-            (text_width, text_height) = self.text_font.size(line)
+            (text_width, text_height) = _measure_text_line(text_font, line)
 
-            text_border_surface = pygame.Surface((text_width + self._text_border_size * 2, text_height + self._text_border_size * 2)).convert_alpha()
-            text_border_surface.fill((0, 0, 0, 0))
-            text_border_surface.blit(self._text_font.render(line, True, self._text_border_color).convert_alpha(), (0, 0))
+            # Allocated with per pixel alpha, already transparent and in the format convert_alpha would have produced.
+            text_border_surface = pygame.Surface((text_width + text_border_size * 2, text_height + text_border_size * 2), pygame.SRCALPHA)
+            text_border_surface.blit(_render_text_line(text_font, line, text_border_color), (0, 0))
 
             drawable_text_surface = text_border_surface.copy()
             drawable_text_surface.set_alpha(self._text_transparency)
 
-            for x, y in _circle_points(self._text_border_size):
-                drawable_text_surface.blit(text_border_surface, (x + self._text_border_size, y + self._text_border_size))
+            drawable_text_surface.blits([(text_border_surface, offset) for offset in text_border_offsets], doreturn=False)
+
+            drawable_text_surface.blit(_render_text_line(text_font, line, text_color), (text_border_size, text_border_size))
+
+            line_x = (text_bounds_x - text_width) * text_x_alignment_offset
+            line_y = text_height * last_line_index - text_height * index
+
+            rendered_text_lines.append((drawable_text_surface, line_x, line_y))
+
+        return rendered_text_lines
+
+    def __instance_drawer(self):
+        text = self.text
+
+        # Everything the rendered surfaces depend on, the position of the text is applied when drawing.
+        render_key = (
+            text,
+            self._text_font,
+            tuple(self._text_color),
+            self._text_transparency,
+            tuple(self._text_border_color),
+            self._text_border_size,
+            self._text_x_alignment,
+        )
 
-            drawable_text_surface.blit(self._text_font.render(line, True, self._text_color).convert_alpha(), (self._text_border_size, self._text_border_size))
+        rendered_text_lines = self._cached_text_renders.get(render_key)
+        if rendered_text_lines is None:
+            if len(self._cached_text_renders) >= CACHED_TEXT_RENDERS_LIMIT:
+                del self._cached_text_renders[next(iter(self._cached_text_renders))]
 
-            line_x = (self.text_bounds.x - text_width) * text_x_alignment_offsets[self._text_x_alignment.value]
-            line_y = text_height * (len(text_lines) - 1) - text_height * index
+            self._cached_text_renders[render_key] = rendered_text_lines = self.__render_text_lines(text)
 
-            (text_position_x, text_position_y) = self.text_position
+        (text_position_x, text_position_y) = self._get_text_position()
 
-            self._get_drawable_surface().blit(
-                drawable_text_surface,
-                (
-                    text_position_x + line_x,
-                    text_position_y + line_y,
-                ),
-            )
+        return [(surface, (text_position_x + line_x, text_position_y + line_y)) for surface, line_x, line_y in rendered_text_lines]
@@ -8,6 +8,10 @@ from pygame.event import Event
 
 from pyguilib.components.pygui_instance import PyGuiInstance
 
+CACHED_GIF_SIZES_LIMIT = 2
+
+UNTINTED_GIF_TINT = ((255, 255, 255, 255), 255)
+
 
 class VideoLabel(PyGuiInstance):
     """
@@ -47,31 +51,48 @@ class VideoLabel(PyGuiInstance):
             **kwargs,
         )
 
-        self.__gif_creating_timestamp = time.time()
+        self.__gif_creating_timestamp = time.monotonic()
 
         self._gif_playback_speed = kwargs.get("gif_playback_speed", 1)
+
+        # Read once from the reader, current_gif_frame is computed at least once per update.
+        self._gif_frame_rate = 1000 / self._gif_reader.get_meta_data()["duration"]
+        self._gif_frames_count = self._gif_reader.get_length()
         self._gif_color = kwargs.get("gif_color", (255, 255, 255, 255))
         self._gif_transparency = kwargs.get("gif_transparency", 255)
 
-        self._gif_frames = []
+        # Decoded (and rotated) once, the frames are only scaled once they are displayed at a size.
+        self._gif_frames = [
+            pygame.transform.rotate(pygame.surfarray.make_surface(self._gif_reader.get_data(frame)), -90) for frame in range(self._gif_frames_count)
+        ]
 
-        for frame in range(self._gif_reader.get_length()):
-            self._gif_frames.append(
-                pygame.transform.smoothscale(pygame.transform.rotate(pygame.surfarray.make_surface(self._gif_reader.get_data(frame)), -90), self.absolute_size)
-            )
+        self._scaled_gif_frames = {}
 
-        self._register_property_change_listener("gif_playback_speed", lambda _: self.gif_playback_speed)
-        self._register_property_change_listener("gif_color", lambda _: self.gif_color)
-        self._register_property_change_listener("gif_transparency", lambda _: self.gif_transparency)
+        # By frame index, along with the scaled frame and the tint they were made from.
+        self._tinted_gif_frames = {}
+
+        self._last_drawn_gif_frame = None
 
         self._add_instance_updater_handler(self.__instance_updater)
         self._add_instance_drawer_handler(self.__instance_drawer)
 
-        self.get_property_changed_signal("size").connect(lambda *_: self.__update_gif_scale_transform())
+    def __get_scaled_gif_frame(self, frame: int) -> pygame.Surface:
+        absolute_size = self.absolute_size
+        scaled_size = (int(absolute_size.x), int(absolute_size.y))
+
+        scaled_gif_frames = self._scaled_gif_frames.get(scaled_size)
+        if scaled_gif_frames is None:
+            if len(self._scaled_gif_frames) >= CACHED_GIF_SIZES_LIMIT:
+                del self._scaled_gif_frames[next(iter(self._scaled_gif_frames))]
+
+            self._scaled_gif_frames[scaled_size] = scaled_gif_frames = [None] * len(self._gif_frames)
 
-    def __update_gif_scale_transform(self):
-        for index in range(self._gif_reader.get_length()):
-            self._gif_frames[index] = pygame.transform.smoothscale(self._gif_frames[index], self.absolute_size)
+        # Always scaled from the decoded frame, scaling an already scaled frame again would lose its quality.
+        scaled_gif_frame = scaled_gif_frames[frame]
+        if scaled_gif_frame is None:
+            scaled_gif_frames[frame] = scaled_gif_frame = pygame.transform.smoothscale(self._gif_frames[frame], scaled_size)
+
+        return scaled_gif_frame
 
     @property
     def current_gif_frame(self) -> int:
@@ -81,9 +102,7 @@ class VideoLabel(PyGuiInstance):
         Returns:
             int: Index of the current GIF frame.
         """
-        return (
-            int((time.time() - self.__gif_creating_timestamp) * (1000 / self._gif_reader.get_meta_data()["duration"]) * self._gif_playback_speed)
-        ) % self._gif_reader.get_length()
+        return int((time.monotonic() - self.__gif_creating_timestamp) * self._gif_frame_rate * self._gif_playback_speed) % self._gif_frames_count
 
     def pause():
         """
@@ -108,9 +127,10 @@ class VideoLabel(PyGuiInstance):
         return self._gif_playback_speed
 
     @gif_playback_speed.setter
+    @PyGuiInstance._update_screen_buffer
     def gif_playback_speed(self, value: int):
         self._gif_playback_speed = value
-        self._invoke_property_change_listener("gif_playback_speed")
+        self._invoke_property_change_listener("gif_playback_speed", value)
 
     @property
     def gif_color(self) -> Color:
@@ -123,9 +143,10 @@ class VideoLabel(PyGuiInstance):
         return self._gif_color
 
     @gif_color.setter
+    @PyGuiInstance._update_screen_buffer
     def gif_color(self, value: Color):
         self._gif_color = value
-        self._invoke_property_change_listener("gif_color")
+        self._invoke_property_change_listener("gif_color", value)
 
     @property
     def gif_transparency(self) -> int:
@@ -138,18 +159,36 @@ class VideoLabel(PyGuiInstance):
         return self._gif_transparency
 
     @gif_transparency.setter
+    @PyGuiInstance._update_screen_buffer
     def gif_transparency(self, value: int):
         self._gif_transparency = value
-        self._invoke_property_change_listener("gif_transparency")
+        self._invoke_property_change_listener("gif_transparency", value)
 
     def __instance_updater(self, events: List[Event]):
-        self.clear()
-        self.draw()
+        current_gif_frame = self.current_gif_frame
+
+        # Only redrawn (along with whatever overlaps it) once the GIF actually advanced to another frame.
+        if current_gif_frame != self._last_drawn_gif_frame and self._BUILT:
+            self._last_drawn_gif_frame = current_gif_frame
+            self._request_redraw()
 
     def __instance_drawer(self):
-        current_frame = self._gif_frames[self.current_gif_frame].copy()
+        current_gif_frame = self.current_gif_frame
+        scaled_gif_frame = self.__get_scaled_gif_frame(current_gif_frame)
+
+        gif_tint = (tuple(self.gif_color), self.gif_transparency)
+
+        # The scaled frame is only ever blitted from, it can be drawn as is when there is nothing to tint.
+        if gif_tint == UNTINTED_GIF_TINT:
+            return [(scaled_gif_frame, self.absolute_position)]
+
+        tinted_gif_frame = self._tinted_gif_frames.get(current_gif_frame)
+        if tinted_gif_frame is None or tinted_gif_frame[0] is not scaled_gif_frame or tinted_gif_frame[1] != gif_tint:
+            tinted_surface = scaled_gif_frame.copy()
+
+            tinted_surface.set_alpha(self.gif_transparency)
+            tinted_surface.fill(self.gif_color, special_flags=pygame.BLEND_RGBA_MULT)
 
-        current_frame.set_alpha(self.gif_transparency)
-        current_frame.fill(self.gif_color, special_flags=pygame.BLEND_RGBA_MULT)
+            self._tinted_gif_frames[current_gif_frame] = tinted_gif_frame = (scaled_gif_frame, gif_tint, tinted_surface)
 
-        self._get_drawable_surface().blit(current_frame, self.absolute_position)
+        return [(tinted_gif_frame[2], self.absolute_position)]
@@ -1,10 +1,10 @@
 import traceback
-from typing import List
+from typing import List, Optional, Tuple
 
 import pygame
 from pygame.event import Event
 
-from pyguilib.components.pygui_instance import PyGuiInstance
+from pyguilib.components.pygui_instance import PyGuiInstance, flush_moved_instances, flush_pending_redraws
 from pyguilib.services.action_service import update as action_service_update
 from pyguilib.services.tween_service import update as tween_service_update
 from pyguilib.utilities.quadtree import Quadtree
@@ -35,34 +35,113 @@ class PyGui(PyGuiInstance):
         if not pygame.get_init():
             raise Exception("Pygame is not initialized")
 
+        self._BUILT = True
+
+        super(PyGui, self).__init__(
+            position=UDim2.of(0, 0, 0, 0), size=UDim2.of(1, 0, 1, 0), name="PyGui"
+        )
+
         self._root_quadtree_reference = Quadtree(
             0, pygame.Rect(0, 0, *pygame.display.get_surface().get_size())
         )
 
-        self._BUILT = True
+        # Index of every GUI element in the drawing order, rebuilt along with the flattened subtree it comes from.
+        self._drawing_order_indices = {}
+        self._drawing_order_indices_source = None
 
-        super(PyGui, self).__init__(
-            position=UDim2(0, 0, 0, 0), size=UDim2(1, 0, 1, 0), name="PyGui"
-        )
+        # Position, flattened subtree and result of the last _get_instance_at, the mouse is usually still.
+        self._instance_at_cache = None
+
+        # Filled by every quadtree query of __query_instance_at, cleared rather than allocated again for each.
+        self._queried_items = []
 
         instantiated_pygui_instances.append(self)
 
+    def _get_instance_at(self, position: Tuple[int, int]) -> Optional[PyGuiInstance]:
+        """
+        Get the topmost visible GUI element at a position of the display.
+
+        Args:
+            position (Tuple[int, int]): The position of the display.
+
+        Returns:
+            Optional[PyGuiInstance]: The GUI element drawn last at the position, or None if there is none.
+        """
+        flattened_subtree = self._get_flattened_subtree()
+
+        # Whatever could change the result (geometry, visibility, drawing order) requests a redraw or rebuilds the subtree.
+        if (
+            self._instance_at_cache is not None
+            and self._instance_at_cache[0] == position
+            and self._instance_at_cache[1] is flattened_subtree
+            and not self._has_pending_redraws()
+        ):
+            return self._instance_at_cache[2]
+
+        topmost_instance = self.__query_instance_at(position, flattened_subtree)
+        self._instance_at_cache = (position, flattened_subtree, topmost_instance)
+
+        return topmost_instance
+
+    def __query_instance_at(self, position: Tuple[int, int], flattened_subtree: Tuple[list, list]) -> Optional[PyGuiInstance]:
+        retrieved_items = self._queried_items
+        retrieved_items.clear()
+
+        self._root_quadtree_reference.query(pygame.Rect(position, (1, 1)), retrieved_items)
 
-def update(events: List[Event]):
+        if not retrieved_items:
+            return None
+
+        if self._drawing_order_indices_source is not flattened_subtree:
+            self._drawing_order_indices = {instance: index for index, instance in enumerate(flattened_subtree[0])}
+            self._drawing_order_indices_source = flattened_subtree
+
+        topmost_instance = None
+        topmost_drawing_order_index = -1
+
+        for retrieved_item in retrieved_items:
+            instance = retrieved_item.item
+            drawing_order_index = self._drawing_order_indices.get(instance, -1)
+
+            # Only the candidates drawn above the current one have to be checked for being hidden by an ancestor.
+            if drawing_order_index > topmost_drawing_order_index and _is_shown(instance):
+                topmost_instance = instance
+                topmost_drawing_order_index = drawing_order_index
+
+        return topmost_instance
+
+
+def _is_shown(instance: PyGuiInstance) -> bool:
+    while instance is not None:
+        if not instance.visible:
+            return False
+
+        instance = instance._parent
+
+    return True
+
+
+def update(events: List[Event]) -> List[pygame.Rect]:
     """
     Update function for PyGui, responsible for handling events and updating services.
 
     Args:
         events (List[Event]): List of pygame events.
+
+    Returns:
+        List[pygame.Rect]: The rects of the display redrawn during the update, they can be passed to pygame.display.update.
     """
     global current_mouse_over_instance, last_mouse_over_instance
     global last_pygame_window_size
 
-    this_frame_pygame_window_size = pygame.display.get_surface().get_size()
+    # The display surface is only looked up once per frame, the GUI elements draw on the cached one.
+    PyGuiInstance._cache_display_surface(pygame.display.get_surface())
+
+    this_frame_pygame_window_size = PyGuiInstance._get_display_size()
     if last_pygame_window_size is None or last_pygame_window_size != this_frame_pygame_window_size:
         for pygui in instantiated_pygui_instances:
-            pygui.clear()
-            pygui.draw()
+            pygui._invalidate_absolute_geometry()
+            pygui._request_redraw()
 
         last_pygame_window_size = this_frame_pygame_window_size
 
@@ -72,13 +151,13 @@ def update(events: List[Event]):
         except Exception:
             print(f"An error occurred while updating a service: {traceback.format_exc()}")
 
+    # Moved by the services or during the last update, the hit tests below must see where they are now.
+    flush_moved_instances()
+
     for pygui in instantiated_pygui_instances:
-        retrieved_childs = pygui._root_quadtree_reference.query(
-            pygame.Rect(*pygame.mouse.get_pos(), 1, 1)
-        )
+        deepest_retrieved_child = pygui._get_instance_at(pygame.mouse.get_pos())
 
-        if len(retrieved_childs) > 0:
-            deepest_retrieved_child = retrieved_childs[-1].item
+        if deepest_retrieved_child is not None:
 
             if current_mouse_over_instance != deepest_retrieved_child:
                 if last_mouse_over_instance is not None:
@@ -105,3 +184,5 @@ def update(events: List[Event]):
             current_mouse_over_instance = None
 
         pygui.update(events)
+
+    return flush_pending_redraws()
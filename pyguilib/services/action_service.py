@@ -1,3 +1,6 @@
+import bisect
+import heapq
+import itertools
 from enum import Enum
 from typing import Any, Callable, List, Optional
 
@@ -19,7 +22,14 @@ class ActionResult(Enum):
     PASS = 1
 
 
-binds_events_queue = []
+# The binds triggered by each event type or key, sorted by priority (then by binding order). The lists are replaced
+# instead of mutated so actions can be bound and unbound while they are being walked.
+_binds_by_event = {}
+
+# The binds by action name.
+_binds_by_name = {}
+
+_binds_counter = itertools.count()
 
 
 def bind_action(
@@ -42,10 +52,18 @@ def bind_action(
     Raises:
         ValueError: If an action with the same name already exists.
     """
-    if any(bind[0] == action_name for bind in binds_events_queue):
+    if action_name in _binds_by_name:
         raise ValueError(f"An action with the name {action_name} already exists")
 
-    binds_events_queue.append((action_name, callback, events, priority + (INTERNAL_PRIORITY_THRESHOLD if internal else 0)))
+    bind = (priority + (INTERNAL_PRIORITY_THRESHOLD if internal else 0), next(_binds_counter), action_name, callback, frozenset(events))
+
+    for event in bind[4]:
+        event_binds = list(_binds_by_event.get(event, ()))
+        bisect.insort(event_binds, bind)
+
+        _binds_by_event[event] = event_binds
+
+    _binds_by_name[action_name] = bind
 
 
 def unbind_action(action_name: str):
@@ -55,7 +73,40 @@ def unbind_action(action_name: str):
     Args:
         action_name (str): Name of the action to unbind.
     """
-    binds_events_queue[:] = [bind for bind in binds_events_queue if bind[0] != action_name]
+    bind = _binds_by_name.pop(action_name, None)
+    if bind is None:
+        return
+
+    for event in bind[4]:
+        event_binds = _binds_by_event[event]
+
+        if len(event_binds) == 1:
+            del _binds_by_event[event]
+            continue
+
+        # The priority and binding order of the bind are unique, they locate it in the sorted binds.
+        bind_index = bisect.bisect_left(event_binds, bind[:2])
+        _binds_by_event[event] = event_binds[:bind_index] + event_binds[bind_index + 1 :]
+
+
+def _get_event_binds(event: Event) -> List[tuple]:
+    type_binds = _binds_by_event.get(getattr(event, "type", None), ())
+    key_binds = _binds_by_event.get(getattr(event, "key", None), ())
+
+    if not key_binds:
+        return type_binds
+
+    if not type_binds:
+        return key_binds
+
+    # Both sorted, the binds triggered by the type and the key of the event are merged in order (and only called once).
+    event_binds = []
+
+    for bind in heapq.merge(type_binds, key_binds):
+        if not event_binds or event_binds[-1] is not bind:
+            event_binds.append(bind)
+
+    return event_binds
 
 
 def update(events: List[Event]):
@@ -66,15 +117,7 @@ def update(events: List[Event]):
         events (List[Event]): List of pygame events.
     """
     for event in events:
-        event_handled = False
-
-        for _, callback, events, _ in sorted(binds_events_queue, key=lambda item: item[3]):
-            if (event.type if hasattr(event, "type") else None) in events or (event.key if hasattr(event, "key") else None) in events:
-                if callback(event) == ActionResult.SINK:
-                    event_handled = True
-
-            if event_handled:
+        for _, _, _, callback, _ in _get_event_binds(event):
+            # A sunk event is not passed to the remaining callbacks, the next events still are.
+            if callback(event) == ActionResult.SINK:
                 break
-
-        if event_handled:
-            break
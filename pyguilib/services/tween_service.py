@@ -89,7 +89,38 @@ class TweenType(Enum):
     BOUNCE_IN_OUT = 30
 
 
+# The powers of 2 of the exponential easers are computed as math.exp(x * ln(2)), which is faster than math.pow.
+LN2_10 = 10 * math.log(2)
+LN2_20 = 20 * math.log(2)
+
+# Where each bounce of bounce_out starts and peaks, divided by the duration of the bounces (2.75) once and for all.
+BOUNCE_AMPLITUDE = 7.5625
+BOUNCE_FIRST_THRESHOLD = 1 / 2.75
+BOUNCE_SECOND_THRESHOLD = 2 / 2.75
+BOUNCE_SECOND_CENTER = 1.5 / 2.75
+BOUNCE_THIRD_THRESHOLD = 2.5 / 2.75
+BOUNCE_THIRD_CENTER = 2.25 / 2.75
+BOUNCE_FOURTH_CENTER = 2.625 / 2.75
+
+# How far the back easers overshoot, back_in_out overshoots further as each of its halves lasts half the duration.
+BACK_OVERSHOOT = 1.70158
+BACK_OVERSHOOT_CUBIC = BACK_OVERSHOOT + 1
+BACK_IN_OUT_OVERSHOOT = BACK_OVERSHOOT * 1.525
+BACK_IN_OUT_OVERSHOOT_CUBIC = BACK_IN_OUT_OVERSHOOT + 1
+
+# The sine phases of the elastic easers, (alpha * 10 - 10.75) * (2 * pi / 3) expanded into alpha * scale + shift.
+ELASTIC_SCALE = 10 * (2 * math.pi) / 3
+ELASTIC_IN_SHIFT = -10.75 * (2 * math.pi) / 3
+ELASTIC_OUT_SHIFT = -0.75 * (2 * math.pi) / 3
+ELASTIC_IN_OUT_SCALE = 20 * (2 * math.pi) / 4.5
+ELASTIC_IN_OUT_SHIFT = -11.125 * (2 * math.pi) / 4.5
+
+
 # https://easings.net/
+def linear(alpha):
+    return alpha
+
+
 def sine_in(alpha):
     return 1 - math.cos(alpha * math.pi / 2)
 
@@ -111,7 +142,11 @@ def quad_out(alpha):
 
 
 def quad_in_out(alpha):
-    return 2 * alpha * alpha if alpha < 0.5 else 1 - math.pow(-2 * alpha + 2, 2) / 2
+    if alpha < 0.5:
+        return 2 * alpha * alpha
+
+    inverse = -2 * alpha + 2
+    return 1 - inverse * inverse / 2
 
 
 def cubic_in(alpha):
@@ -119,11 +154,16 @@ def cubic_in(alpha):
 
 
 def cubic_out(alpha):
-    return 1 - math.pow(1 - alpha, 3)
+    inverse = 1 - alpha
+    return 1 - inverse * inverse * inverse
 
 
 def cubic_in_out(alpha):
-    return 4 * alpha * alpha * alpha if alpha < 0.5 else 1 - math.pow(-2 * alpha + 2, 3) / 2
+    if alpha < 0.5:
+        return 4 * alpha * alpha * alpha
+
+    inverse = -2 * alpha + 2
+    return 1 - inverse * inverse * inverse / 2
 
 
 def quart_in(alpha):
@@ -131,11 +171,18 @@ def quart_in(alpha):
 
 
 def quart_out(alpha):
-    return 1 - math.pow(1 - alpha, 4)
+    inverse = 1 - alpha
+    inverse *= inverse
+    return 1 - inverse * inverse
 
 
 def quart_in_out(alpha):
-    return 8 * alpha * alpha * alpha * alpha if alpha < 0.5 else 1 - math.pow(-2 * alpha + 2, 4) / 2
+    if alpha < 0.5:
+        return 8 * alpha * alpha * alpha * alpha
+
+    inverse = -2 * alpha + 2
+    inverse *= inverse
+    return 1 - inverse * inverse / 2
 
 
 def quint_in(alpha):
@@ -143,77 +190,83 @@ def quint_in(alpha):
 
 
 def quint_out(alpha):
-    return 1 - math.pow(1 - alpha, 5)
+    inverse = 1 - alpha
+    return 1 - inverse * inverse * inverse * inverse * inverse
 
 
 def quint_in_out(alpha):
-    return 16 * alpha * alpha * alpha * alpha * alpha if alpha < 0.5 else 1 - math.pow(-2 * alpha + 2, 5) / 2
+    if alpha < 0.5:
+        return 16 * alpha * alpha * alpha * alpha * alpha
+
+    inverse = -2 * alpha + 2
+    return 1 - inverse * inverse * inverse * inverse * inverse / 2
 
 
 def expo_in(alpha):
-    return 0 if alpha == 0 else math.pow(2, 10 * alpha - 10)
+    return 0 if alpha == 0 else math.exp(LN2_10 * alpha - LN2_10)
 
 
 def expo_out(alpha):
-    return 1 if alpha == 1 else 1 - math.pow(2, -10 * alpha)
+    return 1 if alpha == 1 else 1 - math.exp(-LN2_10 * alpha)
 
 
 def expo_in_out(alpha):
-    return 0 if alpha == 0 else 1 if alpha == 1 else math.pow(2, 20 * alpha - 10) / 2 if alpha < 0.5 else (2 - math.pow(2, -20 * alpha * 2 + 10)) / 2
+    return 0 if alpha == 0 else 1 if alpha == 1 else math.exp(LN2_20 * alpha - LN2_10) / 2 if alpha < 0.5 else (2 - math.exp(-LN2_20 * alpha + LN2_10)) / 2
 
 
 def circ_in(alpha):
-    return 1 - math.sqrt(1 - math.pow(alpha, 2))
+    return 1 - math.sqrt(1 - alpha * alpha)
 
 
 def circ_out(alpha):
-    return math.sqrt(1 - math.pow(alpha - 1, 2))
+    inverse = alpha - 1
+    return math.sqrt(1 - inverse * inverse)
 
 
 def circ_in_out(alpha):
-    return (1 - math.sqrt(1 - math.pow(2 * alpha, 2))) / 2 if alpha < 0.5 else (math.sqrt(1 - math.pow(-2 * alpha + 2, 2)) + 1) / 2
+    if alpha < 0.5:
+        doubled = 2 * alpha
+        return (1 - math.sqrt(1 - doubled * doubled)) / 2
+
+    inverse = -2 * alpha + 2
+    return (math.sqrt(1 - inverse * inverse) + 1) / 2
 
 
 def back_in(alpha):
-    bounce = 1.70158
-    return (bounce + 1) * alpha * alpha * alpha - bounce * alpha * alpha
+    return alpha * alpha * (BACK_OVERSHOOT_CUBIC * alpha - BACK_OVERSHOOT)
 
 
 def back_out(alpha):
-    bounce = 1.70158
-    return 1 + (bounce + 1) * math.pow(alpha - 1, 3) + bounce * math.pow(alpha - 1, 2)
+    inverse = alpha - 1
+    return 1 + inverse * inverse * (BACK_OVERSHOOT_CUBIC * inverse + BACK_OVERSHOOT)
 
 
 def back_in_out(alpha):
-    bounce = 1.70158 * 1.525
-    return (
-        (math.pow(2 * alpha, 2) * ((bounce + 1) * 2 * alpha - bounce)) / 2
-        if alpha < 0.5
-        else (math.pow(2 * alpha - 2, 2) * ((bounce + 1) * (alpha * 2 - 2) + bounce) + 2) / 2
-    )
+    if alpha < 0.5:
+        doubled = 2 * alpha
+        return doubled * doubled * (BACK_IN_OUT_OVERSHOOT_CUBIC * doubled - BACK_IN_OUT_OVERSHOOT) / 2
+
+    inverse = 2 * alpha - 2
+    return (inverse * inverse * (BACK_IN_OUT_OVERSHOOT_CUBIC * inverse + BACK_IN_OUT_OVERSHOOT) + 2) / 2
 
 
 def elastic_in(alpha):
-    elasticity = (2 * math.pi) / 3
-    return 0 if alpha == 0 else 1 if alpha == 1 else -math.pow(2, 10 * alpha - 10) * math.sin((alpha * 10 - 10.75) * elasticity)
+    return 0 if alpha == 0 else 1 if alpha == 1 else -math.exp(LN2_10 * alpha - LN2_10) * math.sin(ELASTIC_SCALE * alpha + ELASTIC_IN_SHIFT)
 
 
 def elastic_out(alpha):
-    elasticity = (2 * math.pi) / 3
-    return 0 if alpha == 0 else 1 if alpha == 1 else math.pow(2, -10 * alpha) * math.sin((alpha * 10 - 0.75) * elasticity) + 1
+    return 0 if alpha == 0 else 1 if alpha == 1 else math.exp(-LN2_10 * alpha) * math.sin(ELASTIC_SCALE * alpha + ELASTIC_OUT_SHIFT) + 1
 
 
 def elastic_in_out(alpha):
-    elasticity = (2 * math.pi) / 4.5
-    return (
-        0
-        if alpha == 0
-        else 1
-        if alpha == 1
-        else -(math.pow(2, 20 * alpha - 10) * math.sin((20 * alpha - 11.125) * elasticity)) / 2
-        if alpha < 0.5
-        else (math.pow(2, -20 * alpha + 10) * math.sin((20 * alpha - 11.125) * elasticity)) / 2 + 1
-    )
+    if alpha == 0 or alpha == 1:
+        return alpha
+
+    sine = math.sin(ELASTIC_IN_OUT_SCALE * alpha + ELASTIC_IN_OUT_SHIFT)
+    if alpha < 0.5:
+        return -math.exp(LN2_20 * alpha - LN2_10) * sine / 2
+
+    return math.exp(-LN2_20 * alpha + LN2_10) * sine / 2 + 1
 
 
 def bounce_in(alpha):
@@ -221,49 +274,99 @@ def bounce_in(alpha):
 
 
 def bounce_out(alpha):
-    amplitude = 7.5625
-    duration = 2.75
-
-    if alpha < 1 / duration:
-        return amplitude * alpha * alpha
-    elif alpha < 2 / duration:
-        alpha -= 1.5 / duration
-        return amplitude * alpha * alpha + 0.75
-    elif alpha < 2.5 / duration:
-        alpha -= 2.25 / duration
-        return amplitude * alpha * alpha + 0.9375
+    if alpha < BOUNCE_FIRST_THRESHOLD:
+        return BOUNCE_AMPLITUDE * alpha * alpha
+    elif alpha < BOUNCE_SECOND_THRESHOLD:
+        alpha -= BOUNCE_SECOND_CENTER
+        return BOUNCE_AMPLITUDE * alpha * alpha + 0.75
+    elif alpha < BOUNCE_THIRD_THRESHOLD:
+        alpha -= BOUNCE_THIRD_CENTER
+        return BOUNCE_AMPLITUDE * alpha * alpha + 0.9375
     else:
-        alpha -= 2.625 / duration
-        return amplitude * alpha * alpha + 0.984375
+        alpha -= BOUNCE_FOURTH_CENTER
+        return BOUNCE_AMPLITUDE * alpha * alpha + 0.984375
 
 
 def bounce_in_out(alpha):
     return (1 - bounce_out(1 - 2 * alpha)) / 2 if alpha < 0.5 else (1 + bounce_out(2 * alpha - 1)) / 2
 
 
+TWEEN_FUNCTIONS = {
+    TweenType.LINEAR: linear,
+    TweenType.SINE_IN: sine_in,
+    TweenType.SINE_OUT: sine_out,
+    TweenType.SINE_IN_OUT: sine_in_out,
+    TweenType.QUAD_IN: quad_in,
+    TweenType.QUAD_OUT: quad_out,
+    TweenType.QUAD_IN_OUT: quad_in_out,
+    TweenType.CUBIC_IN: cubic_in,
+    TweenType.CUBIC_OUT: cubic_out,
+    TweenType.CUBIC_IN_OUT: cubic_in_out,
+    TweenType.QUART_IN: quart_in,
+    TweenType.QUART_OUT: quart_out,
+    TweenType.QUART_IN_OUT: quart_in_out,
+    TweenType.QUINT_IN: quint_in,
+    TweenType.QUINT_OUT: quint_out,
+    TweenType.QUINT_IN_OUT: quint_in_out,
+    TweenType.EXPO_IN: expo_in,
+    TweenType.EXPO_OUT: expo_out,
+    TweenType.EXPO_IN_OUT: expo_in_out,
+    TweenType.CIRC_IN: circ_in,
+    TweenType.CIRC_OUT: circ_out,
+    TweenType.CIRC_IN_OUT: circ_in_out,
+    TweenType.BACK_IN: back_in,
+    TweenType.BACK_OUT: back_out,
+    TweenType.BACK_IN_OUT: back_in_out,
+    TweenType.ELASTIC_IN: elastic_in,
+    TweenType.ELASTIC_OUT: elastic_out,
+    TweenType.ELASTIC_IN_OUT: elastic_in_out,
+    TweenType.BOUNCE_IN: bounce_in,
+    TweenType.BOUNCE_OUT: bounce_out,
+    TweenType.BOUNCE_IN_OUT: bounce_in_out,
+}
+
+
 def map(start, end, alpha, min_value=float("-inf"), max_value=float("inf")):
     return max(min(start + (end - start) * alpha, max_value), min_value)
 
 
+def _lerp(start, end, alpha):
+    return start + (end - start) * alpha
+
+
+def _map_color(start, end, alpha):
+    # Only the channels have to be clamped, the easers overshoot (back, elastic), positions and sizes may go past their targets.
+    return Color(
+        min(255, max(0, int(start.r + (end.r - start.r) * alpha))),
+        min(255, max(0, int(start.g + (end.g - start.g) * alpha))),
+        min(255, max(0, int(start.b + (end.b - start.b) * alpha))),
+        min(255, max(0, int(start.a + (end.a - start.a) * alpha))),
+    )
+
+
+def _map_vector2(start, end, alpha):
+    return Vector2(start.x + (end.x - start.x) * alpha, start.y + (end.y - start.y) * alpha)
+
+
+def _map_udim2(start, end, alpha):
+    return UDim2(
+        start.scale_x + (end.scale_x - start.scale_x) * alpha,
+        start.offset_x + (end.offset_x - start.offset_x) * alpha,
+        start.scale_y + (end.scale_y - start.scale_y) * alpha,
+        start.offset_y + (end.offset_y - start.offset_y) * alpha,
+    )
+
+
 PROPERTIES_MAPPERS = {
-    int: map,
-    float: map,
-    Color: lambda start, end, alpha: Color(
-        int(map(start.r, end.r, alpha, min_value=0, max_value=255)),
-        int(map(start.g, end.g, alpha, min_value=0, max_value=255)),
-        int(map(start.b, end.b, alpha, min_value=0, max_value=255)),
-        int(map(start.a, end.a, alpha, min_value=0, max_value=255)),
-    ),
-    Vector2: lambda start, end, alpha: Vector2(map(start.x, end.x, alpha), map(start.y, end.y, alpha)),
-    UDim2: lambda start, end, alpha: UDim2(
-        map(start.x.scale, end.x.scale, alpha),
-        map(start.x.offset, end.x.offset, alpha),
-        map(start.y.scale, end.y.scale, alpha),
-        map(start.y.offset, end.y.offset, alpha),
-    ),
+    int: _lerp,
+    float: _lerp,
+    Color: _map_color,
+    Vector2: _map_vector2,
+    UDim2: _map_udim2,
 }
 
-instantiated_tweens = []
+# Playing tweens in the order they were played, a dict so an ended tween is removed without searching for it.
+instantiated_tweens = {}
 
 
 class Tween(object):
@@ -294,6 +397,9 @@ class Tween(object):
     ) -> "Tween":
         self._original_properties = {}
 
+        # Everything update needs to step each property, resolved once instead of on every frame.
+        self._tweened_properties = []
+
         for property_name, property_value in properties.items():
             try:
                 assert type(property_value) == type(instance[property_name])
@@ -302,7 +408,12 @@ class Tween(object):
             except AttributeError:
                 raise Exception(f"Property {property_name} is not a valid property")
 
+            property_mapper = PROPERTIES_MAPPERS.get(type(property_value))
+            if property_mapper is None:
+                raise Exception(f"Property {property_name} of type {type(property_value)} can not be tweened")
+
             self._original_properties[property_name] = instance[property_name]
+            self._tweened_properties.append((property_name, self._original_properties[property_name], property_value, property_mapper))
 
         self._instance = instance
         self._properties = properties
@@ -315,74 +426,18 @@ class Tween(object):
         self._start_time = 0
         self._end_time = 0
         
-        match tween_type:
-            case TweenType.LINEAR:
-                self._tween_function = lambda alpha: alpha
-            case TweenType.SINE_IN:
-                self._tween_function = sine_in
-            case TweenType.SINE_OUT:
-                self._tween_function = sine_out
-            case TweenType.SINE_IN_OUT:
-                self._tween_function = sine_in_out
-            case TweenType.QUAD_IN:
-                self._tween_function = quad_in
-            case TweenType.QUAD_OUT:
-                self._tween_function = quad_out
-            case TweenType.QUAD_IN_OUT:
-                self._tween_function = quad_in_out
-            case TweenType.CUBIC_IN:
-                self._tween_function = cubic_in
-            case TweenType.CUBIC_OUT:
-                self._tween_function = cubic_out
-            case TweenType.CUBIC_IN_OUT:
-                self._tween_function = cubic_in_out
-            case TweenType.QUART_IN:
-                self._tween_function = quart_in
-            case TweenType.QUART_OUT:
-                self._tween_function = quart_out
-            case TweenType.QUART_IN_OUT:
-                self._tween_function = quart_in_out
-            case TweenType.QUINT_IN:
-                self._tween_function = quint_in
-            case TweenType.QUINT_OUT:
-                self._tween_function = quint_out
-            case TweenType.QUINT_IN_OUT:
-                self._tween_function = quint_in_out
-            case TweenType.EXPO_IN:
-                self._tween_function = expo_in
-            case TweenType.EXPO_OUT:
-                self._tween_function = expo_out
-            case TweenType.EXPO_IN_OUT:
-                self._tween_function = expo_in_out
-            case TweenType.CIRC_IN:
-                self._tween_function = circ_in
-            case TweenType.CIRC_OUT:
-                self._tween_function = circ_out
-            case TweenType.CIRC_IN_OUT:
-                self._tween_function = circ_in_out
-            case TweenType.BACK_IN:
-                self._tween_function = back_in
-            case TweenType.BACK_OUT:
-                self._tween_function = back_out
-            case TweenType.BACK_IN_OUT:
-                self._tween_function = back_in_out
-            case TweenType.ELASTIC_IN:
-                self._tween_function = elastic_in
-            case TweenType.ELASTIC_OUT:
-                self._tween_function = elastic_out
-            case TweenType.ELASTIC_IN_OUT:
-                self._tween_function = elastic_in_out
-            case TweenType.BOUNCE_IN:
-                self._tween_function = bounce_in
-            case TweenType.BOUNCE_OUT:
-                self._tween_function = bounce_out
-            case TweenType.BOUNCE_IN_OUT:
-                self._tween_function = bounce_in_out
-            case _:
-                raise Exception(f"Unknown tween type {tween_type}")
+        self._tween_function = TWEEN_FUNCTIONS.get(tween_type)
+        if self._tween_function is None:
+            raise Exception(f"Unknown tween type {tween_type}")
 
         self.tween_ended = PyGuiSignal()
 
+        def on_tween_ended(tween_status: TweenStatus):
+            instantiated_tweens.pop(self, None)
+
+        # Connected once, playing the tween again must not stack more of it.
+        self.tween_ended.connect(on_tween_ended)
+
     @property
     def alpha(self) -> float:
         """
@@ -391,7 +446,10 @@ class Tween(object):
         Returns:
             float: Current progress of the tween as a value between 0 and 1.
         """
-        return max(0, min(1, (time.time() - self._start_time) / self._duration))
+        return self._get_alpha_at(time.perf_counter())
+
+    def _get_alpha_at(self, now: float) -> float:
+        return max(0, min(1, (now - self._start_time) / self._duration))
 
     def play(self):
         """Starts or resumes the tween."""
@@ -400,15 +458,10 @@ class Tween(object):
 
         self._tween_status = TweenStatus.PLAYING
 
-        self._start_time = time.time()
-        self._end_time = time.time() + self._duration
-
-        instantiated_tweens.append(self)
+        self._start_time = time.perf_counter()
+        self._end_time = self._start_time + self._duration
 
-        def on_tween_ended(tween_status: TweenStatus):
-            instantiated_tweens.remove(self)
-
-        self.tween_ended.connect(on_tween_ended)
+        instantiated_tweens[self] = None
 
     def pause(self):
         """Not implemented."""
@@ -429,21 +482,29 @@ def update(events: List[Event]):
     Args:
         events (List[Event]): List of pygame events.
     """
+    # Read once, every tween of the update is advanced to the same time.
+    now = time.perf_counter()
+
+    # Grouped by instance, each instance is blocked (and then redrawn) once for all of its tweens.
+    tweens_by_instance = {}
+
     for tween in instantiated_tweens:
-        tween._instance.BLOCKING_SCREEN_BUFFER_UPDATE = True
+        tweens_by_instance.setdefault(tween._instance, []).append(tween)
 
-        tweened_alpha = tween._tween_function(tween.alpha)
-        for property_name, property_value in tween._properties.items():
-            tween._instance[property_name] = PROPERTIES_MAPPERS[type(property_value)](
-                tween._original_properties[property_name],
-                property_value,
-                tweened_alpha,
-            )
+    for instance, instance_tweens in tweens_by_instance.items():
+        with instance._defer_redraws():
+            for tween in instance_tweens:
+                if now > tween._end_time:
+                    # The last frame lands on the targets themselves, there is nothing left to ease or map.
+                    for property_name, _, property_value, _ in tween._tweened_properties:
+                        instance[property_name] = property_value
 
-        if time.time() > tween._end_time:
-            tween._tween_status = TweenStatus.ENDED
+                    tween._tween_status = TweenStatus.ENDED
+                else:
+                    tweened_alpha = tween._tween_function(tween._get_alpha_at(now))
 
-        if tween._tween_status != TweenStatus.PLAYING:
-            tween.tween_ended.fire(tween._tween_status)
+                    for property_name, original_value, property_value, property_mapper in tween._tweened_properties:
+                        instance[property_name] = property_mapper(original_value, property_value, tweened_alpha)
 
-        tween._instance.BLOCKING_SCREEN_BUFFER_UPDATE = False
+                if tween._tween_status != TweenStatus.PLAYING:
+                    tween.tween_ended.fire(tween._tween_status)
@@ -1,4 +1,4 @@
-from typing import Any, Callable, List, Tuple
+from typing import Any, Callable, List, Optional, Tuple
 
 from pygame import Rect
 
@@ -8,6 +8,14 @@ MAX_DEPTH = 10
 quadtrees_items_inventory = {}
 
 
+def _get_containing_quadrant(quadtree: "Quadtree", rect: Rect) -> Optional["Quadtree"]:
+    for quadrant in quadtree._quadrants:
+        if quadrant._rect.contains(rect):
+            return quadrant
+
+    return None
+
+
 class QuadTreeItem(object):
     """
     Represents an item within a Quadtree.
@@ -34,6 +42,14 @@ class QuadTreeItem(object):
         self._get_location = get_location
         self._get_size = get_size
 
+        # Where the item was when it got inserted, so it can still be found once it moved.
+        self._inserted_rect = None
+
+        # The last rect built and the position and size it was built from, the getters usually hand out the same objects.
+        self._rect = None
+        self._rect_position = None
+        self._rect_size = None
+
     @property
     def item(self) -> Any:
         """
@@ -72,7 +88,16 @@ class QuadTreeItem(object):
         Returns:
             Rect: The Rect object representing the item's position and size.
         """
-        return Rect(self.position, self.size)
+        position = self._get_location()
+        size = self._get_size()
+
+        # Rebuilt (not updated in place) so the rects handed out before keep their values.
+        if position is not self._rect_position or size is not self._rect_size:
+            self._rect = Rect(position, size)
+            self._rect_position = position
+            self._rect_size = size
+
+        return self._rect
 
 
 class Quadtree(object):
@@ -88,7 +113,7 @@ class Quadtree(object):
         insert(self, item: QuadTreeItem): Inserts a QuadTreeItem into the Quadtree.
         remove(self, item: QuadTreeItem): Removes a QuadTreeItem from the Quadtree.
         subdivide(self): Subdivides the Quadtree into four sub-Quadtrees.
-        query(self, rect: Rect) -> List[QuadTreeItem]: Queries the Quadtree for items within a given Rect.
+        query(self, rect: Rect, items: Optional[List[QuadTreeItem]] = None) -> List[QuadTreeItem]: Queries the Quadtree for items within a given Rect.
         reset(self): Resets the Quadtree by clearing objects and sub-Quadtrees.
     """
 
@@ -117,17 +142,26 @@ class Quadtree(object):
         Args:
             item (QuadTreeItem): The QuadTreeItem to be inserted.
         """
-        if self._rect.contains(item.rect):
-            if len(self._objects) < CAPACITY or self._depth > MAX_DEPTH:
-                self._objects.append(item)
-            else:
-                if not self._quadrants:
-                    self.subdivide()
-
-                self._quadrants[0].insert(item)
-                self._quadrants[1].insert(item)
-                self._quadrants[2].insert(item)
-                self._quadrants[3].insert(item)
+        if self._depth == 0:
+            item._inserted_rect = item.rect
+
+        inserted_rect = item._inserted_rect
+
+        # Walked down rather than recursively, a Python call per level costs more than the checks themselves.
+        quadtree = self
+
+        while len(quadtree._objects) >= CAPACITY and quadtree._depth <= MAX_DEPTH:
+            if not quadtree._quadrants:
+                quadtree.subdivide()
+
+            # Only the quadrant wholly containing the item gets it, an item overlapping several stays in their parent.
+            containing_quadrant = _get_containing_quadrant(quadtree, inserted_rect)
+            if containing_quadrant is None:
+                break
+
+            quadtree = containing_quadrant
+
+        quadtree._objects.append(item)
 
     def remove(self, item: QuadTreeItem):
         """
@@ -136,47 +170,62 @@ class Quadtree(object):
         Args:
             item (QuadTreeItem): The QuadTreeItem to be removed.
         """
-        if self._rect.contains(item.rect):
-            if item in self._objects:
-                self._objects.remove(item)
-            else:
-                for quadrant in self._quadrants:
-                    quadrant.remove(item)
+        inserted_rect = item._inserted_rect
+        if inserted_rect is None:
+            return
+
+        # Follows the same path insert took, down to the quadtree holding the item.
+        quadtree = self
+
+        while quadtree is not None:
+            if item in quadtree._objects:
+                quadtree._objects.remove(item)
+                return
+
+            quadtree = _get_containing_quadrant(quadtree, inserted_rect)
 
     def subdivide(self):
         """Subdivides the Quadtree into four sub-Quadtrees."""
-        width = self._rect.width
-        height = self._rect.height
+        (left, top, right, bottom) = (self._rect.left, self._rect.top, self._rect.right, self._rect.bottom)
 
-        (center_x, center_y) = self._rect.center
+        # Integer midpoints, the quadrants of an odd sized quadtree still cover every one of its pixels.
+        center_x = (left + right) >> 1
+        center_y = (top + bottom) >> 1
 
-        top_left_x = center_x - width / 2
-        top_left_y = center_y - height / 2
+        depth = self._depth + 1
 
-        self._quadrants.append(Quadtree(self._depth + 1, Rect(top_left_x, top_left_y, width / 2, height / 2)))
-        self._quadrants.append(Quadtree(self._depth + 1, Rect(center_x, top_left_y, width / 2, height / 2)))
-        self._quadrants.append(Quadtree(self._depth + 1, Rect(top_left_x, center_y, width / 2, height / 2)))
-        self._quadrants.append(Quadtree(self._depth + 1, Rect(center_x, center_y, width / 2, height / 2)))
+        self._quadrants.append(Quadtree(depth, Rect(left, top, center_x - left, center_y - top)))
+        self._quadrants.append(Quadtree(depth, Rect(center_x, top, right - center_x, center_y - top)))
+        self._quadrants.append(Quadtree(depth, Rect(left, center_y, center_x - left, bottom - center_y)))
+        self._quadrants.append(Quadtree(depth, Rect(center_x, center_y, right - center_x, bottom - center_y)))
 
-    def query(self, rect: Rect) -> List[QuadTreeItem]:
+    def query(self, rect: Rect, items: Optional[List[QuadTreeItem]] = None) -> List[QuadTreeItem]:
         """
         Queries the Quadtree for items within a given Rect.
 
         Args:
             rect (Rect): The Rect representing the query area.
+            items (Optional[List[QuadTreeItem]]): A list the found items are appended to, a new one if omitted.
 
         Returns:
             List[QuadTreeItem]: The list of QuadTreeItems within the query area.
         """
-        items = []
+        if items is None:
+            items = []
+
+        quadtrees = [self]
+
+        while quadtrees:
+            quadtree = quadtrees.pop()
+
+            if not quadtree._rect.contains(rect):
+                continue
 
-        if self._rect.contains(rect):
-            for item in self._objects:
+            for item in quadtree._objects:
                 if item.rect.contains(rect):
                     items.append(item)
 
-            for quadrant in self._quadrants:
-                items.extend(quadrant.query(rect))
+            quadtrees.extend(quadtree._quadrants)
 
         return items
 
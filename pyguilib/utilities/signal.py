@@ -21,26 +21,28 @@ class PyGuiConnection(object):
         disconnect(self): Disconnects the connection from the associated PyGuiSignal.
     """
 
+    __slots__ = ("_connected", "_signal", "_callback")
+
     def __init__(self, signal: PyGuiSignal, callback: Callable[[Any], Any]) -> "PyGuiConnection":
         self._connected = True
-        self._next = None
 
         self._signal = signal
         self._callback = callback
 
     def disconnect(self):
         """Disconnects the connection from the associated PyGuiSignal."""
-        self._connected = False
+        if not self._connected:
+            return
 
-        if self._signal._handler_list_head == self:
-            self._signal._handler_list_head = self._next
-        else:
-            current = self._signal._handler_list_head
+        # Skipped from now on (even by a fire in progress), only dropped from the connections once enough of them are dead.
+        self._connected = False
 
-            while current._next != self:
-                current = current._next
+        signal = self._signal
+        signal._disconnected_count += 1
 
-            current._next = self._next
+        if signal._disconnected_count * 2 > len(signal._connections):
+            signal._connections = tuple(connection for connection in signal._connections if connection._connected)
+            signal._disconnected_count = 0
 
 
 class PyGuiSignal(object):
@@ -53,8 +55,14 @@ class PyGuiSignal(object):
         wait(self): Placeholder method for potential future use.
     """
 
+    __slots__ = ("_connections", "_disconnected_count")
+
     def __init__(self) -> "PyGuiSignal":
-        self._handler_list_head = None
+        # Replaced instead of modified, so firing never has to copy it to stay safe from (dis)connections in callbacks.
+        self._connections = ()
+
+        # Disconnected connections still in _connections, compacted once they are the majority.
+        self._disconnected_count = 0
 
     def connect(self, callback: Callable[[Any], Any]) -> PyGuiConnection:
         """
@@ -68,10 +76,8 @@ class PyGuiSignal(object):
         """
         connection = PyGuiConnection(self, callback)
 
-        if self._handler_list_head:
-            connection._next = self._handler_list_head
-
-        self._handler_list_head = connection
+        # The latest connection is called first.
+        self._connections = (connection,) + self._connections
 
         return connection
 
@@ -82,12 +88,9 @@ class PyGuiSignal(object):
         Args:
             arguments (Any): The arguments to be passed to the connected callback functions.
         """
-        item = self._handler_list_head
-        while item:
-            if item._connected:
-                item._callback(arguments)
-
-            item = item._next
+        for connection in self._connections:
+            if connection._connected:
+                connection._callback(arguments)
 
     def wait(self):
         """Not implemented."""
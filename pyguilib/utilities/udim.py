@@ -1,4 +1,30 @@
-from pygame import Vector2
+from typing import Tuple
+
+# Values handed out by UDim.of and UDim2.of, shared by every caller asking for the same numbers (both classes are immutable).
+UDIMS_POOL_LIMIT = 4096
+
+udims_pool = {}
+udims2_pool = {}
+
+
+def _new_udim(scale: float, offset: float) -> "UDim":
+    # Skips UDim's constructor, for numbers already known to be floats.
+    udim = UDim.__new__(UDim)
+    udim._scale = scale
+    udim._offset = offset
+
+    return udim
+
+
+def _new_udim2(scale_x: float, offset_x: float, scale_y: float, offset_y: float) -> "UDim2":
+    # Skips UDim2's constructor, for numbers already known to be floats.
+    udim2 = UDim2.__new__(UDim2)
+    udim2._scale_x = scale_x
+    udim2._offset_x = offset_x
+    udim2._scale_y = scale_y
+    udim2._offset_y = offset_y
+
+    return udim2
 
 
 class UDim(object):
@@ -16,14 +42,45 @@ class UDim(object):
         __truediv__(self, other: "UDim") -> "UDim": Division of two UDim instances.
         __floordiv__(self, other: "UDim") -> "UDim": Floor division of two UDim instances.
         __str__(self) -> str: String representation of the UDim instance.
+        __eq__(self, other: object) -> bool: Equality of two UDim instances.
+        __hash__(self) -> int: Hash of the UDim instance.
+        of(scale: float, offset: float) -> "UDim": Returns a shared UDim instance.
 
     Properties:
         scale (float): The scaling factor of the UDim.
         offset (float): The offset of the UDim.
     """
 
+    # _string is only set once the UDim gets printed, the common case pays nothing for it.
+    __slots__ = ("_scale", "_offset", "_string")
+
     def __init__(self, scale: float, offset: float) -> "UDim":
-        self._vector = Vector2(scale, offset)
+        # Converted like the pygame.Vector2 they used to be stored in, so they are read back as floats.
+        self._scale = float(scale)
+        self._offset = float(offset)
+
+    @staticmethod
+    def of(scale: float, offset: float) -> "UDim":
+        """
+        Returns a shared UDim instance for the given scale and offset, creating it on the first call.
+
+        Args:
+            scale (float): The scaling factor of the UDim.
+            offset (float): The offset of the UDim.
+
+        Returns:
+            UDim: The shared UDim instance.
+        """
+        key = (scale, offset)
+
+        udim = udims_pool.get(key)
+        if udim is None:
+            udim = UDim(scale, offset)
+
+            if len(udims_pool) < UDIMS_POOL_LIMIT:
+                udims_pool[key] = udim
+
+        return udim
 
     @property
     def scale(self) -> float:
@@ -31,7 +88,7 @@ class UDim(object):
         Returns:
             float: The scaling factor of the UDim.
         """
-        return self._vector.x
+        return self._scale
 
     @property
     def offset(self) -> float:
@@ -39,37 +96,68 @@ class UDim(object):
         Returns:
             float: The offset of the UDim.
         """
-        return self._vector.y
+        return self._offset
+
+    def __eq__(self, other: object) -> bool:
+        """Compares the scale and offset of two UDim instances."""
+        if not isinstance(other, UDim):
+            return NotImplemented
+
+        return self._scale == other._scale and self._offset == other._offset
+
+    def __hash__(self) -> int:
+        """Hashes the scale and offset of the UDim instance."""
+        return hash((self._scale, self._offset))
 
     def __add__(self, other: "UDim") -> "UDim":
         """Adds two UDim instances."""
-        return UDim(self.scale + other.scale, self.offset + other.offset)
+        if other is _UDIM_ZERO:
+            return self
+
+        return _new_udim(self._scale + other._scale, self._offset + other._offset)
 
     def __sub__(self, other: "UDim") -> "UDim":
         """Subtracts two UDim instances."""
-        return UDim(self.scale - other.scale, self.offset - other.offset)
+        if other is _UDIM_ZERO:
+            return self
+
+        return _new_udim(self._scale - other._scale, self._offset - other._offset)
 
     def __mul__(self, other: "UDim") -> "UDim":
         """Multiplies two UDim instances."""
-        return UDim(self.scale * other.scale, self.offset * other.offset)
+        if other is _UDIM_IDENTITY:
+            return self
+
+        return _new_udim(self._scale * other._scale, self._offset * other._offset)
 
     def __truediv__(self, other: "UDim") -> "UDim":
         """Divides two UDim instances."""
-        return UDim(self.scale / other.scale, self.offset / other.offset)
+        if other is _UDIM_IDENTITY:
+            return self
+
+        return _new_udim(self._scale / other._scale, self._offset / other._offset)
 
     def __floordiv__(self, other: "UDim") -> "UDim":
         """Floor divides two UDim instances."""
-        return UDim(self.scale // other.scale, self.offset // other.offset)
+        return _new_udim(self._scale // other._scale, self._offset // other._offset)
 
     def __str__(self) -> str:
         """Returns a string representation of the UDim instance."""
-        return f"UDim({self.scale}, {self.offset})"
+        string = getattr(self, "_string", None)
+        if string is None:
+            string = self._string = f"UDim({self._scale}, {self._offset})"
+
+        return string
 
 
 class UDim2(object):
     """
     Represents a two-dimensional user interface dimension (UDim2) with separate X and Y dimensions.
 
+    Note:
+        UDim2 instances are immutable, so they can be pooled, hashed and shared between GUI elements. Use with_x and
+        with_y to get a changed copy.
+
     Args:
         scale_x (float): The scaling factor of the X dimension.
         offset_x (float): The offset of the X dimension.
@@ -83,31 +171,78 @@ class UDim2(object):
         __truediv__(self, other: "UDim2") -> "UDim2": Division of two UDim2 instances.
         __floordiv__(self, other: "UDim2") -> "UDim2": Floor division of two UDim2 instances.
         __str__(self) -> str: String representation of the UDim2 instance.
+        __eq__(self, other: object) -> bool: Equality of two UDim2 instances.
+        __hash__(self) -> int: Hash of the UDim2 instance.
+        from_offset(offset_x: float, offset_y: float) -> "UDim2": Creates a UDim2 instance with only offsets.
+        of(scale_x: float, offset_x: float, scale_y: float, offset_y: float) -> "UDim2": Returns a shared UDim2 instance.
+        resolve(self, width: float, height: float) -> Tuple[float, float]: Resolves the UDim2 instance against a size.
+        with_x(self, scale: float, offset: float) -> "UDim2": Returns a copy with another X dimension.
+        with_y(self, scale: float, offset: float) -> "UDim2": Returns a copy with another Y dimension.
 
     Properties:
         x (UDim): The UDim instance for the X dimension.
         y (UDim): The UDim instance for the Y dimension.
+        scale_x (float): The scaling factor of the X dimension.
+        offset_x (float): The offset of the X dimension.
+        scale_y (float): The scaling factor of the Y dimension.
+        offset_y (float): The offset of the Y dimension.
     """
 
+    # The four numbers are stored flat, the UDim of each dimension is only built when asked for. _string is set once printed.
+    __slots__ = ("_scale_x", "_offset_x", "_scale_y", "_offset_y", "_string")
+
     def __init__(self, scale_x: float, offset_x: float, scale_y: float, offset_y: float) -> "UDim2":
-        self._x = UDim(scale_x, offset_x)
-        self._y = UDim(scale_y, offset_y)
+        self._scale_x = float(scale_x)
+        self._offset_x = float(offset_x)
+        self._scale_y = float(scale_y)
+        self._offset_y = float(offset_y)
 
-    @property
-    def x(self) -> UDim:
+    @staticmethod
+    def from_offset(offset_x: float, offset_y: float) -> "UDim2":
+        """
+        Creates a UDim2 instance with zero scales, skipping the constructor call.
+
+        Args:
+            offset_x (float): The offset of the X dimension.
+            offset_y (float): The offset of the Y dimension.
+
+        Returns:
+            UDim2: The UDim2 instance.
+        """
+        return _new_udim2(0.0, float(offset_x), 0.0, float(offset_y))
+
+    @staticmethod
+    def of(scale_x: float, offset_x: float, scale_y: float, offset_y: float) -> "UDim2":
         """
+        Returns a shared UDim2 instance for the given scales and offsets, creating it on the first call.
+
+        Args:
+            scale_x (float): The scaling factor of the X dimension.
+            offset_x (float): The offset of the X dimension.
+            scale_y (float): The scaling factor of the Y dimension.
+            offset_y (float): The offset of the Y dimension.
+
         Returns:
-            UDim: The UDim instance for the X dimension.
+            UDim2: The shared UDim2 instance, which must not be modified.
         """
-        return self._x
+        key = (scale_x, offset_x, scale_y, offset_y)
+
+        udim2 = udims2_pool.get(key)
+        if udim2 is None:
+            udim2 = UDim2(scale_x, offset_x, scale_y, offset_y)
+
+            if len(udims2_pool) < UDIMS_POOL_LIMIT:
+                udims2_pool[key] = udim2
 
-    @x.setter
-    def x(self, value: UDim):
+        return udim2
+
+    @property
+    def x(self) -> UDim:
         """
         Returns:
             UDim: The UDim instance for the X dimension.
         """
-        self._x = value
+        return _new_udim(self._scale_x, self._offset_x)
 
     @property
     def y(self) -> UDim:
@@ -115,61 +250,171 @@ class UDim2(object):
         Returns:
             UDim: The UDim instance for the Y dimension.
         """
-        return self._y
+        return _new_udim(self._scale_y, self._offset_y)
 
-    @y.setter
-    def y(self, value: UDim):
+    def with_x(self, scale: float, offset: float) -> "UDim2":
         """
+        Returns a copy of the UDim2 instance with another X dimension, without building a UDim for it.
+
+        Args:
+            scale (float): The scaling factor of the X dimension.
+            offset (float): The offset of the X dimension.
+
         Returns:
-            UDim: The UDim instance for the Y dimension.
+            UDim2: The new UDim2 instance, to be assigned back to the property it came from.
+        """
+        return _new_udim2(float(scale), float(offset), self._scale_y, self._offset_y)
+
+    def with_y(self, scale: float, offset: float) -> "UDim2":
+        """
+        Returns a copy of the UDim2 instance with another Y dimension, without building a UDim for it.
+
+        Args:
+            scale (float): The scaling factor of the Y dimension.
+            offset (float): The offset of the Y dimension.
+
+        Returns:
+            UDim2: The new UDim2 instance, to be assigned back to the property it came from.
+        """
+        return _new_udim2(self._scale_x, self._offset_x, float(scale), float(offset))
+
+    @property
+    def scale_x(self) -> float:
+        """
+        Returns:
+            float: The scaling factor of the X dimension.
+        """
+        return self._scale_x
+
+    @property
+    def offset_x(self) -> float:
+        """
+        Returns:
+            float: The offset of the X dimension.
+        """
+        return self._offset_x
+
+    @property
+    def scale_y(self) -> float:
+        """
+        Returns:
+            float: The scaling factor of the Y dimension.
         """
-        self._y = value
+        return self._scale_y
+
+    @property
+    def offset_y(self) -> float:
+        """
+        Returns:
+            float: The offset of the Y dimension.
+        """
+        return self._offset_y
+
+    def resolve(self, width: float, height: float) -> Tuple[float, float]:
+        """
+        Resolves the UDim2 instance against a size, without building any intermediate UDim2.
+
+        Args:
+            width (float): The width the X scale is relative to.
+            height (float): The height the Y scale is relative to.
+
+        Returns:
+            Tuple[float, float]: The resolved X and Y values.
+        """
+        return (width * self._scale_x + self._offset_x, height * self._scale_y + self._offset_y)
+
+    def __eq__(self, other: object) -> bool:
+        """Compares the scales and offsets of two UDim2 instances."""
+        if not isinstance(other, UDim2):
+            return NotImplemented
+
+        return (
+            self._scale_x == other._scale_x
+            and self._offset_x == other._offset_x
+            and self._scale_y == other._scale_y
+            and self._offset_y == other._offset_y
+        )
+
+    def __hash__(self) -> int:
+        """Hashes the scales and offsets of the UDim2 instance."""
+        return hash((self._scale_x, self._offset_x, self._scale_y, self._offset_y))
 
     def __add__(self, other: "UDim2") -> "UDim2":
         """Adds two UDim2 instances."""
-        return UDim2(
-            self.x.scale + other.x.scale,
-            self.x.offset + other.x.offset,
-            self.y.scale + other.y.scale,
-            self.y.offset + other.y.offset,
+        if other is _UDIM2_ZERO:
+            return self
+
+        return _new_udim2(
+            self._scale_x + other._scale_x,
+            self._offset_x + other._offset_x,
+            self._scale_y + other._scale_y,
+            self._offset_y + other._offset_y,
         )
 
     def __sub__(self, other: "UDim2") -> "UDim2":
         """Subtracts two UDim2 instances."""
-        return UDim2(
-            self.x.scale - other.x.scale,
-            self.x.offset - other.x.offset,
-            self.y.scale - other.y.scale,
-            self.y.offset - other.y.offset,
+        if other is _UDIM2_ZERO:
+            return self
+
+        return _new_udim2(
+            self._scale_x - other._scale_x,
+            self._offset_x - other._offset_x,
+            self._scale_y - other._scale_y,
+            self._offset_y - other._offset_y,
         )
 
     def __mul__(self, other: "UDim2") -> "UDim2":
         """Multiplies two UDim2 instances."""
-        return UDim2(
-            self.x.scale * other.x.scale,
-            self.x.offset * other.x.offset,
-            self.y.scale * other.y.scale,
-            self.y.offset * other.y.offset,
+        if other is _UDIM2_IDENTITY:
+            return self
+
+        return _new_udim2(
+            self._scale_x * other._scale_x,
+            self._offset_x * other._offset_x,
+            self._scale_y * other._scale_y,
+            self._offset_y * other._offset_y,
         )
 
     def __truediv__(self, other: "UDim2") -> "UDim2":
         """Divides two UDim2 instances."""
-        return UDim2(
-            self.x.scale / other.x.scale,
-            self.x.offset / other.x.offset,
-            self.y.scale / other.y.scale,
-            self.y.offset / other.y.offset,
+        if other is _UDIM2_IDENTITY:
+            return self
+
+        return _new_udim2(
+            self._scale_x / other._scale_x,
+            self._offset_x / other._offset_x,
+            self._scale_y / other._scale_y,
+            self._offset_y / other._offset_y,
         )
 
     def __floordiv__(self, other: "UDim2") -> "UDim2":
         """Floor divides two UDim2 instances."""
-        return UDim2(
-            self.x.scale // other.x.scale,
-            self.x.offset // other.x.offset,
-            self.y.scale // other.y.scale,
-            self.y.offset // other.y.offset,
+        return _new_udim2(
+            self._scale_x // other._scale_x,
+            self._offset_x // other._offset_x,
+            self._scale_y // other._scale_y,
+            self._offset_y // other._offset_y,
         )
 
     def __str__(self) -> str:
         """Returns a string representation of the UDim2 instance."""
-        return f"UDim2({self.x.scale}, {self.x.offset}, {self.y.scale}, {self.y.offset})"
+        string = getattr(self, "_string", None)
+        if string is None:
+            string = self._string = f"UDim2({self._scale_x}, {self._offset_x}, {self._scale_y}, {self._offset_y})"
+
+        return string
+
+
+# Pooled up front, the values layouts and GUI elements default to.
+for udim_values in ((0, 0), (1, 0)):
+    UDim.of(*udim_values)
+
+for udim2_values in ((0, 0, 0, 0), (1, 0, 1, 0)):
+    UDim2.of(*udim2_values)
+
+# Adding or subtracting the shared zero, or multiplying or dividing by the shared identity, returns the left operand itself.
+# Only safe because UDim and UDim2 are immutable, a result can never be changed without changing the operand with it.
+_UDIM_ZERO = UDim.of(0, 0)
+_UDIM_IDENTITY = UDim.of(1, 1)
+_UDIM2_ZERO = UDim2.of(0, 0, 0, 0)
+_UDIM2_IDENTITY = UDim2.of(1, 1, 1, 1)
@@ -0,0 +1,41 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from pyguilib import PyGui
+from pyguilib.components import Frame
+from pyguilib.pyguilib import update
+from pyguilib.utilities import UDim2
+
+
+class BlockingScreenBufferUpdateTest(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((200, 200))
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_changes_made_while_blocked_are_drawn_once_unblocked(self):
+        gui = PyGui()
+        frame = Frame(parent=gui, position=UDim2(0, 10, 0, 10), size=UDim2(0, 20, 0, 20)).build()
+        update([])
+
+        background_color = self.screen.get_at((105, 105))
+
+        frame.BLOCKING_SCREEN_BUFFER_UPDATE = True
+        frame.position = UDim2(0, 100, 0, 100)
+        frame.background_color = pygame.Color(255, 0, 0, 255)
+        frame.BLOCKING_SCREEN_BUFFER_UPDATE = False
+        update([])
+
+        self.assertEqual(self.screen.get_at((105, 105)), pygame.Color(255, 0, 0, 255))
+        self.assertEqual(self.screen.get_at((15, 15)), background_color)
+        self.assertIs(gui._get_instance_at((105, 105)), frame)
+
+
+if __name__ == "__main__":
+    unittest.main()